@@ -1,3 +1,17 @@
-from src.agent.agent import AGENT_TIMEOUT, chat, chat_stream, shutdown
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.agent.agent import AGENT_TIMEOUT, chat, chat_stream, shutdown
 
 __all__ = ["AGENT_TIMEOUT", "chat", "chat_stream", "shutdown"]
+
+
+def __getattr__(name: str):
+    # Lazy re-export: importing src.agent.tools.* must not pull in agno
+    if name in __all__:
+        from src.agent import agent
+
+        value = getattr(agent, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -8,143 +8,32 @@ MCP servers (Playwright, Beads) are connected via agno.tools.mcp.MCPTools.
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
-from typing import Any
+import threading
+import time
+from typing import TYPE_CHECKING, Any
 
 from agno.agent import RunEvent
 from agno.db.sqlite import SqliteDb
-from agno.models.openai import OpenAIChat
 from agno.session.summary import SessionSummaryManager
 from agno.team import Team, TeamRunEvent
 from agno.team.team import TeamMode
 
-from src.agent.memory_extractor import extract_memories_background
-from src.agent.team import build_team_members
-from src.agent.tools import (
-    # FFmpeg
-    add_audio,
-    # Contacts
-    add_contact,
-    # Interests
-    add_interest,
-    add_subtask,
-    # Tasks
-    add_tasks,
-    add_text_overlay,
-    # Shopping
-    add_to_list,
-    append_to_note_tool,
-    archive_project,
-    assign_tasks_to_project,
-    assign_to_project,
-    # Beads
-    beads_create,
-    beads_list,
-    beads_ready,
-    # Notes
-    browse_notes,
-    cancel_reminder,
-    check_item,
-    clear_checked,
-    complete_task,
-    concat_videos,
-    create_calendar_event,
-    create_note_tool,
-    # Projects
-    create_project,
-    # Skills
-    create_skill,
-    delete_calendar_event,
-    delete_skill,
-    delete_task_tool,
-    # Media generation
-    edit_image,
-    extract_audio,
-    fetch_url,
-    # Scheduling
-    find_free_slot,
-    find_skill,
-    forget_memory,
-    generate_image,
-    generate_video,
-    # Agenda
-    get_agenda,
-    get_contact_tasks,
-    # Misc
-    get_current_datetime,
-    get_overdue_tasks,
-    get_task_details,
-    get_weather,
-    list_calendar_events,
-    list_interests,
-    list_memories,
-    list_projects_tool,
-    list_reading_list,
-    list_recurring,
-    list_reminders,
-    list_skills,
-    list_tags,
-    list_tasks,
-    # Mood
-    log_mood,
-    mark_read,
-    mood_summary,
-    move_project_tasks,
-    move_task,
-    probe_media,
-    purchase_item,
-    read_note_tool,
-    read_skill,
-    recall_memory,
-    remind_before_deadline,
-    remove_bookmark,
-    remove_contact,
-    remove_interest,
-    remove_item,
-    resize_video,
-    # Code
-    run_python_code,
-    run_shell_command,
-    # Bookmarks
-    save_bookmark,
-    # Memory
-    save_memory,
-    search_notes_tool,
-    search_reading_list,
-    search_tasks_tool,
-    # Files
-    send_file,
-    # Reminders
-    set_reminder,
-    show_contacts,
-    show_gifts_for_contact,
-    show_list,
-    show_mood_history,
-    show_profile,
-    show_project,
-    speed_video,
-    stop_recurring,
-    # Calendar
-    test_calendar,
-    trim_video,
-    unassign_from_project,
-    uncheck_item,
-    upcoming_birthdays,
-    update_calendar_event,
-    update_contact_tool,
-    update_interest_tool,
-    update_note_tool,
-    # Profile
-    update_profile,
-    update_project,
-    update_skill,
-    update_task_tool,
-    # Web
-    web_search,
-)
+from src.agent.memory_extractor import close_client, extract_memories_background
+from src.agent.team import build_team_members, get_model
 from src.config import settings
-from src.db import session_scope
-from src.db.queries import log_agent_event
+from src.db import configure_sqlite_engine, session_scope
+from src.db.queries import (
+    get_active_work,
+    get_recent_completed_work,
+    get_recent_events,
+    list_agent_memories,
+    log_agent_event,
+)
+
+if TYPE_CHECKING:
+    from agno.run import RunContext
 
 logger = logging.getLogger(__name__)
 
@@ -160,7 +49,7 @@ async def _safe_extract(user_message: str, assistant_response: str) -> None:
 # System prompt — format hints are inline, no separate formatter LLM pass
 # ---------------------------------------------------------------------------
 
-SYSTEM_PROMPT_BASE = """\
+SYSTEM_PROMPT_BASE = f"""\
 You are Minion, a personal assistant bot.
 
 Your personality:
@@ -193,10 +82,12 @@ CRITICAL RULES:
 1. NEVER lie about your actions. If you made a mistake, own it immediately.
 2. ONLY perform the exact action requested. Don't "clean up" or modify unrelated data.
 3. When asked to fix X, only touch X. Don't touch Y or Z "while you're at it".
-4. ALWAYS call show_list/show_contacts/list_tasks BEFORE any delete/remove operation to verify IDs.
-   Tool calls are cheap. Deleting the wrong thing is expensive. NEVER guess IDs from memory.
-5. For deletions: if user clearly specified what to delete (e.g., "delete Chikonato with K"), just do it
-   after verifying IDs. Only ask for confirmation when genuinely ambiguous.
+4. NEVER guess IDs from memory. delete_task_tool/remove_item/remove_contact accept an exact name instead
+   of an ID and refuse to act if it matches more than one record — use the name when the user gave it.
+   Call show_list/show_contacts/list_tasks first only when the reference is vague ("that one", a partial
+   name, "the last task"). Deleting the wrong thing is expensive.
+5. For deletions: if user clearly specified what to delete (e.g., "delete Chikonato with K"), just do it.
+   Only ask for confirmation when genuinely ambiguous.
 
 TAGS (Categories):
 When creating tasks, ALWAYS auto-assign a tag based on the task content. NEVER ask the user
@@ -250,7 +141,7 @@ VIDEO EDITING (FFmpeg):
 - speed_video: speed up or slow down (e.g., 2.0 = 2x, 0.5 = half speed)
 - add_text_overlay: burn text onto video (position, timing, color)
 - probe_media: inspect file details (duration, resolution, codecs)
-All output files are saved to data/media/. Use send_file to deliver results.
+All output files are saved to {settings.media_dir}/. Use send_file to deliver results.
 Chain these tools for complex edits (e.g., trim + concat + add audio).
 
 TASK IDs: Always prefixed with # (e.g., #5, #12). Use the exact numeric ID, not list position.
@@ -325,133 +216,266 @@ Use **bold**, *italic*, `code`, ~~strikethrough~~, - bullets.
 NEVER use HTML tags.
 """,
 }
+# Strip surrounding blank lines once — _build_system_prompt already separates blocks.
+FORMAT_HINTS = {name: hint.strip() for name, hint in FORMAT_HINTS.items()}
+
+# Static head of the system prompt per format, joined once at import
+_PROMPT_PREFIXES = {name: f"{SYSTEM_PROMPT_BASE}\n\n{hint}" for name, hint in FORMAT_HINTS.items()}
 
 
 # ---------------------------------------------------------------------------
-# All main tools — plain Python functions
+# All main tools — plain Python functions (built once; MCP tools are appended per build)
 # ---------------------------------------------------------------------------
 
-MAIN_TOOLS: list[Any] = [
-    get_current_datetime,
-    # Tasks
-    add_tasks,
-    update_task_tool,
-    complete_task,
-    get_overdue_tasks,
-    list_tasks,
-    search_tasks_tool,
-    get_task_details,
-    delete_task_tool,
-    add_subtask,
-    move_task,
-    list_tags,
-    list_recurring,
-    stop_recurring,
-    # Projects
-    create_project,
-    list_projects_tool,
-    show_project,
-    assign_to_project,
-    unassign_from_project,
-    archive_project,
-    assign_tasks_to_project,
-    move_project_tasks,
-    update_project,
-    # Reminders
-    set_reminder,
-    list_reminders,
-    cancel_reminder,
-    remind_before_deadline,
-    # Agenda
-    get_agenda,
-    # Calendar
-    test_calendar,
-    create_calendar_event,
-    update_calendar_event,
-    delete_calendar_event,
-    list_calendar_events,
-    # Shopping
-    add_to_list,
-    show_list,
-    check_item,
-    uncheck_item,
-    remove_item,
-    clear_checked,
-    show_gifts_for_contact,
-    purchase_item,
-    # Contacts
-    add_contact,
-    show_contacts,
-    upcoming_birthdays,
-    update_contact_tool,
-    remove_contact,
-    get_contact_tasks,
-    # Notes
-    browse_notes,
-    read_note_tool,
-    create_note_tool,
-    update_note_tool,
-    append_to_note_tool,
-    search_notes_tool,
-    # Profile
-    update_profile,
-    show_profile,
-    get_weather,
-    # Bookmarks
-    save_bookmark,
-    list_reading_list,
-    mark_read,
-    remove_bookmark,
-    search_reading_list,
-    # Mood
-    log_mood,
-    show_mood_history,
-    mood_summary,
-    # Scheduling
-    find_free_slot,
-    # Code
-    run_python_code,
-    run_shell_command,
-    # Web
-    web_search,
-    fetch_url,
-    # Files
-    send_file,
-    # Media generation
-    generate_image,
-    edit_image,
-    generate_video,
-    # FFmpeg / video editing
-    trim_video,
-    concat_videos,
-    add_audio,
-    extract_audio,
-    resize_video,
-    speed_video,
-    add_text_overlay,
-    probe_media,
-    # Interests
-    add_interest,
-    list_interests,
-    remove_interest,
-    update_interest_tool,
-    # Beads
-    beads_create,
-    beads_list,
-    beads_ready,
-    # Memory
-    save_memory,
-    recall_memory,
-    list_memories,
-    forget_memory,
-    # Skills
-    list_skills,
-    find_skill,
-    read_skill,
-    create_skill,
-    update_skill,
-    delete_skill,
-]
+
+@functools.cache
+def _main_tools() -> tuple[Any, ...]:
+    # Deferred: importing every tool module (and its integrations) is only
+    # needed by the first team build, not by importers of this module.
+    from src.agent.tools import (
+        # FFmpeg
+        add_audio,
+        # Contacts
+        add_contact,
+        # Interests
+        add_interest,
+        add_subtask,
+        # Tasks
+        add_tasks,
+        add_text_overlay,
+        # Shopping
+        add_to_list,
+        append_to_note_tool,
+        archive_project,
+        assign_tasks_to_project,
+        assign_to_project,
+        # Beads
+        beads_create,
+        beads_list,
+        beads_ready,
+        # Notes
+        browse_notes,
+        cancel_reminder,
+        check_item,
+        clear_checked,
+        complete_task,
+        concat_videos,
+        create_calendar_event,
+        create_note_tool,
+        # Projects
+        create_project,
+        # Skills
+        create_skill,
+        delete_calendar_event,
+        delete_skill,
+        delete_task_tool,
+        # Media generation
+        edit_image,
+        extract_audio,
+        fetch_url,
+        # Scheduling
+        find_free_slot,
+        find_skill,
+        forget_memory,
+        generate_image,
+        generate_video,
+        # Agenda
+        get_agenda,
+        get_contact_tasks,
+        # Misc
+        get_current_datetime,
+        get_overdue_tasks,
+        get_task_details,
+        get_weather,
+        list_calendar_events,
+        list_interests,
+        list_memories,
+        list_projects_tool,
+        list_reading_list,
+        list_recurring,
+        list_reminders,
+        list_skills,
+        list_tags,
+        list_tasks,
+        # Mood
+        log_mood,
+        mark_read,
+        mood_summary,
+        move_project_tasks,
+        move_task,
+        probe_media,
+        purchase_item,
+        read_note_tool,
+        read_skill,
+        recall_memory,
+        remind_before_deadline,
+        remove_bookmark,
+        remove_contact,
+        remove_interest,
+        remove_item,
+        resize_video,
+        # Code
+        run_python_code,
+        run_shell_command,
+        # Bookmarks
+        save_bookmark,
+        # Memory
+        save_memory,
+        search_notes_tool,
+        search_reading_list,
+        search_tasks_tool,
+        # Files
+        send_file,
+        # Reminders
+        set_reminder,
+        show_contacts,
+        show_gifts_for_contact,
+        show_list,
+        show_mood_history,
+        show_profile,
+        show_project,
+        speed_video,
+        stop_recurring,
+        # Calendar
+        test_calendar,
+        trim_video,
+        unassign_from_project,
+        uncheck_item,
+        upcoming_birthdays,
+        update_calendar_event,
+        update_contact_tool,
+        update_interest_tool,
+        update_note_tool,
+        # Profile
+        update_profile,
+        update_project,
+        update_skill,
+        update_task_tool,
+        # Web
+        web_search,
+    )
+
+    return (
+        get_current_datetime,
+        # Tasks
+        add_tasks,
+        update_task_tool,
+        complete_task,
+        get_overdue_tasks,
+        list_tasks,
+        search_tasks_tool,
+        get_task_details,
+        delete_task_tool,
+        add_subtask,
+        move_task,
+        list_tags,
+        list_recurring,
+        stop_recurring,
+        # Projects
+        create_project,
+        list_projects_tool,
+        show_project,
+        assign_to_project,
+        unassign_from_project,
+        archive_project,
+        assign_tasks_to_project,
+        move_project_tasks,
+        update_project,
+        # Reminders
+        set_reminder,
+        list_reminders,
+        cancel_reminder,
+        remind_before_deadline,
+        # Agenda
+        get_agenda,
+        # Calendar
+        test_calendar,
+        create_calendar_event,
+        update_calendar_event,
+        delete_calendar_event,
+        list_calendar_events,
+        # Shopping
+        add_to_list,
+        show_list,
+        check_item,
+        uncheck_item,
+        remove_item,
+        clear_checked,
+        show_gifts_for_contact,
+        purchase_item,
+        # Contacts
+        add_contact,
+        show_contacts,
+        upcoming_birthdays,
+        update_contact_tool,
+        remove_contact,
+        get_contact_tasks,
+        # Notes
+        browse_notes,
+        read_note_tool,
+        create_note_tool,
+        update_note_tool,
+        append_to_note_tool,
+        search_notes_tool,
+        # Profile
+        update_profile,
+        show_profile,
+        get_weather,
+        # Bookmarks
+        save_bookmark,
+        list_reading_list,
+        mark_read,
+        remove_bookmark,
+        search_reading_list,
+        # Mood
+        log_mood,
+        show_mood_history,
+        mood_summary,
+        # Scheduling
+        find_free_slot,
+        # Code
+        run_python_code,
+        run_shell_command,
+        # Web
+        web_search,
+        fetch_url,
+        # Files
+        send_file,
+        # Media generation
+        generate_image,
+        edit_image,
+        generate_video,
+        # FFmpeg / video editing
+        trim_video,
+        concat_videos,
+        add_audio,
+        extract_audio,
+        resize_video,
+        speed_video,
+        add_text_overlay,
+        probe_media,
+        # Interests
+        add_interest,
+        list_interests,
+        remove_interest,
+        update_interest_tool,
+        # Beads
+        beads_create,
+        beads_list,
+        beads_ready,
+        # Memory
+        save_memory,
+        recall_memory,
+        list_memories,
+        forget_memory,
+        # Skills
+        list_skills,
+        find_skill,
+        read_skill,
+        create_skill,
+        update_skill,
+        delete_skill,
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -460,123 +484,202 @@ MAIN_TOOLS: list[Any] = [
 
 AGENT_TIMEOUT = 1200  # 20 minutes
 
-_team: Team | None = None
+# One Team per (format hint, event loop), built on first use and reused across
+# turns. Each loop gets its own so model clients never cross loops; guarded by a
+# threading lock since the web server runs chat() on its own thread/loop.
+_teams: dict[tuple[str, asyncio.AbstractEventLoop], Team] = {}
+_team_lock = threading.Lock()
 _mcp_tools: list[Any] = []
 _db = SqliteDb(
     session_table="agno_sessions",
     db_file=str(settings.database_path),
 )
-_summary_manager = SessionSummaryManager(
-    model=OpenAIChat(id="gpt-5-mini", api_key=settings.openai_api_key),
-)
+# Agno keeps its own engine on the same file; give its connections the same
+# pragmas so session/summary writes don't fsync per commit or fail on a busy lock.
+configure_sqlite_engine(_db.db_engine)
 
 SESSION_ID = "minion-main"
 
+# Strong references to fire-and-forget tasks — the event loop only keeps weak
+# ones, so an unreferenced task can be garbage-collected mid-flight.
+_background_tasks: set[asyncio.Task[None]] = set()
 
-def _build_system_prompt(format_hint: str) -> str:
-    """Build full system prompt with format hints, memory, and event bus context."""
-    from src.db.queries import get_active_work, get_recent_completed_work, get_recent_events, list_agent_memories
 
-    parts = [SYSTEM_PROMPT_BASE]
+# The skills listing walks the Silverbullet space on disk and rarely changes, so
+# it is reused across turns for a short TTL instead of rescanned every message.
+_SKILLS_TTL_SECONDS = 60.0
+_skills_cache: tuple[float, str] | None = None
 
-    # Inject long-term memories if available
-    try:
-        with session_scope() as session:
-            memories = list_agent_memories(session, limit=20)
-            if memories:
-                lines = ["\nREMEMBERED CONTEXT (from long-term memory):"]
-                for m in memories:
-                    lines.append(f"- [{m.category}] {m.key}: {m.content}")
-                parts.append("\n".join(lines))
-    except Exception:
-        pass
 
-    # Inject recent event bus activity
-    try:
-        with session_scope() as session:
-            events = get_recent_events(session, limit=30, since_hours=24)
-            if events:
-                lines = ["\nRECENT ACTIVITY (last 24h — includes heartbeat, scheduler, and your own responses):"]
-                for e in reversed(events):  # chronological order
-                    ts = e.timestamp.strftime("%H:%M") if e.timestamp else "?"
-                    lines.append(f"- [{ts} {e.source}] {e.event_type}: {e.summary[:200]}")
-                parts.append("\n".join(lines))
-
-            # Show active subagent work
-            active = get_active_work(session)
-            if active:
-                lines = ["\nACTIVE SUBAGENT WORK:"]
-                for w in active:
-                    started = w.started_at.strftime("%H:%M") if w.started_at else "?"
-                    lines.append(f"- {w.agent_name}: {w.description} (started {started})")
-                parts.append("\n".join(lines))
-
-            # Show recently completed work
-            completed = get_recent_completed_work(session, hours=24)
-            if completed:
-                lines = ["\nRECENTLY COMPLETED WORK:"]
-                for w in completed[:5]:
-                    result_preview = w.result[:150] if w.result else "(no result)"
-                    lines.append(f"- {w.agent_name}: {w.description} -> {result_preview}")
-                parts.append("\n".join(lines))
-    except Exception:
-        pass
+def _skills_block() -> str:
+    """Return the AVAILABLE SKILLS prompt block ("" if none), cached for a short TTL."""
+    global _skills_cache
+    now = time.monotonic()
+    cached = _skills_cache
+    if cached is not None and now - cached[0] < _SKILLS_TTL_SECONDS:
+        return cached[1]
 
-    # Inject available skills summary (lightweight — just filenames, no reads)
+    block = ""
     try:
         from src.integrations.silverbullet import list_notes_recursive
 
         skill_notes = list_notes_recursive("Skills")
         if skill_notes:
-            lines = ["\nAVAILABLE SKILLS:"]
-            for sn in skill_notes[:20]:
-                display_name = sn.replace("Skills/", "").removesuffix(".md")
-                lines.append(f"- {display_name}")
-            parts.append("\n".join(lines))
+            block = "AVAILABLE SKILLS:\n" + "\n".join(
+                f"- {sn.replace('Skills/', '').removesuffix('.md')}" for sn in skill_notes[:20]
+            )
     except Exception:
         pass
 
-    # Format-specific instructions
-    fmt = FORMAT_HINTS.get(format_hint, "")
-    if fmt:
-        parts.append(fmt)
+    _skills_cache = (now, block)
+    return block
+
+
+def _build_system_prompt(format_hint: str) -> str:
+    """Build full system prompt with format hints, memory, and event bus context."""
+    # Stable blocks first, volatile ones last: OpenAI's prompt cache matches on the
+    # longest unchanged prefix, so per-turn memory/event context goes at the end.
+    parts = [_PROMPT_PREFIXES.get(format_hint, SYSTEM_PROMPT_BASE)]
+
+    # Inject available skills summary (lightweight — just filenames, no reads)
+    skills = _skills_block()
+    if skills:
+        parts.append(skills)
+
+    # Memory and event-bus context share one read-only session; each group keeps
+    # its own guard so one failing query doesn't drop the other's context.
+    try:
+        with session_scope() as session:
+            # Inject long-term memories if available
+            try:
+                memories = list_agent_memories(session, limit=20)
+                if memories:
+                    parts.append(
+                        "REMEMBERED CONTEXT (from long-term memory):\n"
+                        + "\n".join(f"- [{m.category}] {m.key}: {m.content}" for m in memories)
+                    )
+            except Exception:
+                logger.debug("Failed to load memories for system prompt", exc_info=True)
+
+            # Inject recent event bus activity
+            try:
+                events = get_recent_events(session, limit=30, since_hours=24, order="asc")
+                if events:
+                    parts.append(
+                        "RECENT ACTIVITY (last 24h — includes heartbeat, scheduler, and your own responses):\n"
+                        + "\n".join(
+                            f"- [{e.timestamp.strftime('%H:%M') if e.timestamp else '?'} {e.source}] "
+                            f"{e.event_type}: {e.summary[:200]}"
+                            for e in events
+                        )
+                    )
+
+                # Show active subagent work
+                active = get_active_work(session)
+                if active:
+                    parts.append(
+                        "ACTIVE SUBAGENT WORK:\n"
+                        + "\n".join(
+                            f"- {w.agent_name}: {w.description} "
+                            f"(started {w.started_at.strftime('%H:%M') if w.started_at else '?'})"
+                            for w in active
+                        )
+                    )
+
+                # Show recently completed work
+                completed = get_recent_completed_work(session, hours=24)
+                if completed:
+                    parts.append(
+                        "RECENTLY COMPLETED WORK:\n"
+                        + "\n".join(
+                            f"- {w.agent_name}: {w.description} -> {w.result[:150] if w.result else '(no result)'}"
+                            for w in completed[:5]
+                        )
+                    )
+            except Exception:
+                logger.debug("Failed to load event bus context for system prompt", exc_info=True)
+    except Exception:
+        logger.debug("Failed to open session for system prompt context", exc_info=True)
 
     return "\n\n".join(parts)
 
 
 def set_mcp_tools(tools: list[Any]) -> None:
     """Set MCP tools to be included in the agent. Called from main.py after MCP init."""
-    global _mcp_tools, _team
-    _mcp_tools = tools
-    _team = None  # force rebuild on next call
+    global _mcp_tools
+    with _team_lock:
+        _mcp_tools = tools
+        _teams.clear()  # force rebuild on next call
 
 
-def _get_team(format_hint: str) -> Team:
-    """Lazy-create (or rebuild) the Agno Team."""
-    global _team
+def _create_team(format_hint: str, loop: asyncio.AbstractEventLoop) -> Team:
+    """Build the Agno Team (leader + members) for a format hint on an event loop."""
+    members = build_team_members(loop)
 
-    all_tools = MAIN_TOOLS + _mcp_tools
-
-    members = build_team_members()
-
-    _team = Team(
+    return Team(
         name="Minion",
         mode=TeamMode.coordinate,
-        model=OpenAIChat(id=settings.agent_model, api_key=settings.openai_api_key),
+        model=get_model(settings.agent_model, loop),
         members=members,  # type: ignore[arg-type]
-        tools=all_tools,
-        instructions=[_build_system_prompt(format_hint)],
+        tools=[*_main_tools(), *_mcp_tools],
+        instructions=_run_instructions,
         db=_db,
         num_history_runs=5,
         add_history_to_context=True,
         show_members_responses=True,
         markdown=format_hint == "web",
         enable_session_summaries=True,
-        session_summary_manager=_summary_manager,
+        session_summary_manager=SessionSummaryManager(model=get_model(settings.memory_model, loop)),
         telemetry=False,
     )
 
-    return _team
+
+def _cached_team(format_hint: str, loop: asyncio.AbstractEventLoop) -> Team:
+    """Return the cached Agno Team for this format and loop, creating it on first use."""
+    key = (format_hint, loop)
+    team = _teams.get(key)
+    if team is None:
+        with _team_lock:
+            team = _teams.get(key)
+            if team is None:
+                # Teams of a closed loop can never run again
+                for stale in [k for k in _teams if k[1].is_closed()]:
+                    del _teams[stale]
+                team = _teams[key] = _create_team(format_hint, loop)
+    return team
+
+
+def _run_instructions(run_context: RunContext) -> str:
+    """Team instructions: the system prompt built for the current run.
+
+    The prompt embeds live memory and event-bus context, so each turn passes its
+    own through run dependencies instead of assigning it on the shared Team,
+    where it could overwrite the prompt of a turn still in flight.
+    """
+    return (run_context.dependencies or {}).get("system_prompt", SYSTEM_PROMPT_BASE)
+
+
+def _prepare_turn(format_hint: str, loop: asyncio.AbstractEventLoop) -> tuple[Team, str]:
+    """Return the cached team for this format and loop plus this turn's system prompt."""
+    return _cached_team(format_hint, loop), _build_system_prompt(format_hint)
+
+
+def _record_response(source: str, message: str, response_text: str) -> None:
+    """Log the agent's reply to the event bus and kick off memory extraction."""
+    # An empty reply gives later turns no context and nothing to extract from
+    if not response_text.strip():
+        return
+
+    try:
+        with session_scope() as session:
+            log_agent_event(session, source, "agent_response", response_text[:500])
+    except Exception:
+        logger.debug("Failed to log agent response to event bus", exc_info=True)
+
+    # Extract memories in background (fire-and-forget)
+    task = asyncio.create_task(_safe_extract(message, response_text))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
 
 
 async def chat(message: str, format_hint: str = "telegram") -> str:
@@ -586,9 +689,10 @@ async def chat(message: str, format_hint: str = "telegram") -> str:
         message: User message text.
         format_hint: "telegram" for HTML formatting, "web" for Markdown.
     """
-    logger.info(f"Chat input: {message[:100]}{'...' if len(message) > 100 else ''}")
+    logger.info("Chat input: %.100s%s", message, "..." if len(message) > 100 else "")
 
-    team = _get_team(format_hint)
+    # Prompt building hits SQLite and the Silverbullet space — keep it off the event loop
+    team, system_prompt = await asyncio.to_thread(_prepare_turn, format_hint, asyncio.get_running_loop())
 
     response_text = ""
     try:
@@ -597,6 +701,7 @@ async def chat(message: str, format_hint: str = "telegram") -> str:
                 message,
                 session_id=SESSION_ID,
                 stream=False,
+                dependencies={"system_prompt": system_prompt},
             )
             if response and response.content:
                 response_text = response.content
@@ -607,20 +712,12 @@ async def chat(message: str, format_hint: str = "telegram") -> str:
         logger.exception("chat() error")
         raise
 
+    _record_response("chat", message, response_text)
+
     if not response_text.strip():
         response_text = "Done."
 
-    # Log to event bus
-    try:
-        with session_scope() as session:
-            log_agent_event(session, "chat", "agent_response", response_text[:500])
-    except Exception:
-        logger.debug("Failed to log agent response to event bus", exc_info=True)
-
-    # Extract memories in background (fire-and-forget)
-    asyncio.create_task(_safe_extract(message, response_text))
-
-    logger.info(f"Chat output: {response_text[:100]}{'...' if len(response_text) > 100 else ''}")
+    logger.info("Chat output: %.100s%s", response_text, "..." if len(response_text) > 100 else "")
     return response_text
 
 
@@ -637,10 +734,11 @@ async def chat_stream(message: str, format_hint: str = "telegram"):
         message: User message text.
         format_hint: "telegram" for HTML formatting, "web" for Markdown.
     """
-    logger.info(f"Chat stream input: {message[:100]}{'...' if len(message) > 100 else ''}")
+    logger.info("Chat stream input: %.100s%s", message, "..." if len(message) > 100 else "")
 
-    team = _get_team(format_hint)
-    full_text = ""
+    # Prompt building hits SQLite and the Silverbullet space — keep it off the event loop
+    team, system_prompt = await asyncio.to_thread(_prepare_turn, format_hint, asyncio.get_running_loop())
+    text_chunks: list[str] = []
 
     try:
         async with asyncio.timeout(AGENT_TIMEOUT):
@@ -649,12 +747,13 @@ async def chat_stream(message: str, format_hint: str = "telegram"):
                 session_id=SESSION_ID,
                 stream=True,
                 stream_events=True,
+                dependencies={"system_prompt": system_prompt},
             ):
                 # Team final content
                 if event.event == TeamRunEvent.run_content:
                     chunk = event.content or ""
                     if chunk:
-                        full_text += chunk
+                        text_chunks.append(chunk)
                         yield ("text", chunk)
 
                 # Team-level tool call
@@ -686,20 +785,24 @@ async def chat_stream(message: str, format_hint: str = "telegram"):
         logger.exception("chat_stream error")
         raise
 
-    # Log to event bus
-    if full_text:
-        try:
-            with session_scope() as session:
-                log_agent_event(session, "chat_stream", "agent_response", full_text[:500])
-        except Exception:
-            logger.debug("Failed to log agent response to event bus", exc_info=True)
+    if text_chunks:
+        _record_response("chat_stream", message, "".join(text_chunks))
+
+
+async def warmup() -> None:
+    """Build the calling loop's teams at startup so the first message doesn't pay for construction."""
+    loop = asyncio.get_running_loop()
+
+    def _build_all() -> None:
+        for format_hint in FORMAT_HINTS:
+            _cached_team(format_hint, loop)
 
-        # Extract memories in background (fire-and-forget)
-        asyncio.create_task(_safe_extract(message, full_text))
+    await asyncio.to_thread(_build_all)
 
 
 async def shutdown() -> None:
     """Clean up agent state."""
-    global _team
-    _team = None
+    with _team_lock:
+        _teams.clear()
+    await close_client()
     logger.info("Agno agent cleaned up")
@@ -6,6 +6,7 @@ returns MCPTools instances that can be passed to Agent(tools=[...]).
 
 from __future__ import annotations
 
+import asyncio
 import contextlib
 import logging
 from typing import Any
@@ -47,32 +48,39 @@ def _get_server_configs() -> dict[str, StdioServerParameters]:
     return servers
 
 
+async def _connect(params: StdioServerParameters) -> tuple[MCPTools, Any, Any]:
+    """Spawn one MCP server and return (tools, session, transport)."""
+    # stdio_client returns an async context manager that gives (read, write)
+    transport = stdio_client(params)
+    streams = await transport.__aenter__()
+    read_stream, write_stream = streams
+
+    session = ClientSession(read_stream, write_stream)
+    await session.__aenter__()
+
+    mcp_tools = MCPTools(session=session)
+    await mcp_tools.initialize()
+    return mcp_tools, session, transport
+
+
 async def init_mcp_servers() -> list[MCPTools]:
     """Connect to all configured MCP servers and return MCPTools instances.
 
-    Each MCPTools instance can be passed directly to Agent(tools=[...]).
+    Servers are spawned concurrently — startup is bounded by the slowest
+    npx/uvx handshake rather than their sum. Each MCPTools instance can be
+    passed directly to Agent(tools=[...]).
     """
     configs = _get_server_configs()
     mcp_tools_list: list[MCPTools] = []
 
-    for name, params in configs.items():
-        try:
-            # stdio_client returns an async context manager that gives (read, write)
-            transport = stdio_client(params)
-            streams = await transport.__aenter__()
-            read_stream, write_stream = streams
-
-            session = ClientSession(read_stream, write_stream)
-            await session.__aenter__()
-
-            mcp_tools = MCPTools(session=session)
-            await mcp_tools.initialize()
-
-            _active_connections.append((mcp_tools, session, transport))
-            mcp_tools_list.append(mcp_tools)
-            logger.info(f"MCP server '{name}' connected")
-        except Exception as e:
-            logger.warning(f"MCP server '{name}' failed to connect: {e}")
+    results = await asyncio.gather(*(_connect(params) for params in configs.values()), return_exceptions=True)
+    for name, result in zip(configs, results, strict=True):
+        if isinstance(result, BaseException):
+            logger.warning(f"MCP server '{name}' failed to connect: {result}")
+            continue
+        _active_connections.append(result)
+        mcp_tools_list.append(result[0])
+        logger.info(f"MCP server '{name}' connected")
 
     logger.info(f"MCP init complete: {len(mcp_tools_list)}/{len(configs)} servers connected")
     return mcp_tools_list
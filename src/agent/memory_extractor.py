@@ -1,14 +1,19 @@
 """Subconscious memory extraction — runs after every conversation turn.
 
-A lightweight LLM call (gpt-5-mini) reviews the exchange and extracts
+A lightweight LLM call (settings.memory_model) reviews the exchange and extracts
 durable facts/preferences into the AgentMemory table. Runs as a
 fire-and-forget background task so the user never waits for it.
 """
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
 import logging
+import re
+import threading
+from collections import OrderedDict
 
 from openai import AsyncOpenAI
 
@@ -18,8 +23,6 @@ from src.db.queries import delete_agent_memory, list_agent_memories, save_agent_
 
 logger = logging.getLogger(__name__)
 
-EXTRACTION_MODEL = "gpt-5-mini"
-
 EXTRACTION_PROMPT = """\
 You are a memory extraction system. Given a conversation exchange and existing memories, \
 determine what NEW facts, preferences, or corrections to save.
@@ -47,12 +50,78 @@ person (about contacts), decision (choices made), workflow (how user works)
 - If nothing worth saving, return empty array: []
 """
 
+# Per-side cap on the exchange sent for extraction. Pasted documents or an
+# injected /command output can be tens of KB; durable facts sit near the top.
+_MAX_INPUT_CHARS = 2000
+
+# Acknowledgements like "ok" or "thanks 👍" never carry a durable fact, so
+# they skip the extraction round-trip entirely.
+_TRIVIAL_MESSAGE_RE = re.compile(
+    r"^\W*(ok(ay)?|k|thanks?|thank you|thx|ty|cool|nice|great|perfect)?\W*$",
+    re.IGNORECASE,
+)
+
+# Digests of recently extracted exchanges. A double-sent message (or a web
+# retry) produces the same exchange, and re-extracting it only burns tokens.
+# Extraction runs on both the Telegram and web-server loops (two threads).
+_RECENT_MAX = 128
+_recent_exchanges: OrderedDict[bytes, None] = OrderedDict()
+_recent_lock = threading.Lock()
+
+
+def _seen_recently(digest: bytes) -> bool:
+    with _recent_lock:
+        if digest in _recent_exchanges:
+            _recent_exchanges.move_to_end(digest)
+            return True
+        return False
+
+
+def _remember(digest: bytes) -> None:
+    with _recent_lock:
+        _recent_exchanges[digest] = None
+        if len(_recent_exchanges) > _RECENT_MAX:
+            _recent_exchanges.popitem(last=False)
+
+
+# One client per event loop, reused across turns so its httpx connection pool
+# (and keep-alive TLS sessions) isn't rebuilt for every extraction. Turns finish
+# on two loops — the python-telegram-bot main loop and uvicorn's loop in the
+# web-server thread — and pooled connections are bound to the loop that opened
+# them, so they can't be shared.
+_clients: dict[asyncio.AbstractEventLoop, AsyncOpenAI] = {}
+
+
+def _get_client() -> AsyncOpenAI:
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None:
+        # Forget clients whose loop has gone away (their pools died with it)
+        for stale in [lp for lp in _clients if lp.is_closed()]:
+            del _clients[stale]
+        client = _clients[loop] = AsyncOpenAI(api_key=settings.openai_api_key)
+    return client
+
+
+async def close_client() -> None:
+    """Close the OpenAI client owned by the running event loop, if one was created."""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.close()
+
 
 async def extract_memories(user_message: str, assistant_response: str) -> int:
     """Call a cheap model to extract memories from a conversation exchange.
 
     Returns the number of memory actions applied.
     """
+    if _TRIVIAL_MESSAGE_RE.match(user_message):
+        return 0
+
+    digest = hashlib.blake2b(f"{user_message}\0{assistant_response}".encode(), digest_size=16).digest()
+    if _seen_recently(digest):
+        return 0
+
     # Load existing memories for context
     with session_scope() as session:
         existing = list_agent_memories(session, limit=50)
@@ -64,13 +133,12 @@ async def extract_memories(user_message: str, assistant_response: str) -> int:
 
     prompt = EXTRACTION_PROMPT.format(
         memories=memories_text,
-        user_message=user_message,
-        assistant_response=assistant_response[:2000],
+        user_message=user_message[:_MAX_INPUT_CHARS],
+        assistant_response=assistant_response[:_MAX_INPUT_CHARS],
     )
 
-    client = AsyncOpenAI(api_key=settings.openai_api_key)
-    response = await client.chat.completions.create(
-        model=EXTRACTION_MODEL,
+    response = await _get_client().chat.completions.create(
+        model=settings.memory_model,
         messages=[{"role": "user", "content": prompt}],
         temperature=0,
         max_tokens=1000,
@@ -108,6 +176,8 @@ async def extract_memories(user_message: str, assistant_response: str) -> int:
                 delete_agent_memory(session, key)
                 applied += 1
 
+    # Only a completed extraction counts; failures above propagate and stay retryable
+    _remember(digest)
     return applied
 
 
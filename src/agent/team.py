@@ -6,59 +6,88 @@ The leader (main agent) delegates to members for domain-specific multi-step work
 
 from __future__ import annotations
 
+import asyncio
+import threading
+
 from agno.agent import Agent
 from agno.models.openai import OpenAIChat
+from openai import AsyncOpenAI
 
-# ---------------------------------------------------------------------------
-# Tool imports — plain Python functions from src/agent/tools/
-# ---------------------------------------------------------------------------
-from src.agent.tools import (
-    add_to_list,
-    append_to_note_tool,
-    browse_notes,
-    check_item,
-    create_note_tool,
-    fetch_url,
-    find_free_slot,
-    get_agenda,
-    get_contact_tasks,
-    get_overdue_tasks,
-    get_task_details,
-    list_calendar_events,
-    list_projects_tool,
-    list_tasks,
-    mood_summary,
-    read_note_tool,
-    run_python_code,
-    save_bookmark,
-    search_notes_tool,
-    search_tasks_tool,
-    set_reminder,
-    show_contacts,
-    show_gifts_for_contact,
-    show_list,
-    show_mood_history,
-    show_profile,
-    show_project,
-    update_contact_tool,
-    update_note_tool,
-    web_search,
-)
 from src.config import settings
 
+# One OpenAIChat per (model id, event loop). Agents on the same loop share the
+# instance and its HTTP connection pool; turns run on two loops — the
+# python-telegram-bot main loop and uvicorn's loop in the web-server thread —
+# and pooled connections are bound to the loop that opened them.
+_models: dict[tuple[str, asyncio.AbstractEventLoop], OpenAIChat] = {}
+_models_lock = threading.Lock()  # teams are built in worker threads
+
+
+def get_model(name: str, loop: asyncio.AbstractEventLoop | None = None) -> OpenAIChat:
+    """Return the OpenAIChat instance for a model id on an event loop.
+
+    Args:
+        name: Model id.
+        loop: Loop the model will run on. Defaults to the running loop; pass it
+            explicitly when building agents off-loop (e.g. in asyncio.to_thread).
+    """
+    loop = loop or asyncio.get_running_loop()
+    with _models_lock:
+        model = _models.get((name, loop))
+        if model is None:
+            # Forget models whose loop has gone away (their pools died with it)
+            for stale in [key for key in _models if key[1].is_closed()]:
+                del _models[stale]
+            model = _models[(name, loop)] = OpenAIChat(
+                id=name,
+                api_key=settings.openai_api_key,
+                # Without its own client Agno falls back to one process-wide httpx pool
+                async_client=AsyncOpenAI(api_key=settings.openai_api_key),
+            )
+    return model
 
-def _model(name: str) -> OpenAIChat:
-    """Create an OpenAIChat model instance."""
-    return OpenAIChat(id=name, api_key=settings.openai_api_key)
 
+def build_team_members(loop: asyncio.AbstractEventLoop) -> list[Agent]:
+    """Build the list of Agno Agent members for a Team running on ``loop``."""
+    # Deferred so importing this module (e.g. for get_model) doesn't load the tool modules
+    from src.agent.tools import (
+        add_to_list,
+        append_to_note_tool,
+        browse_notes,
+        check_item,
+        create_note_tool,
+        fetch_url,
+        find_free_slot,
+        get_agenda,
+        get_contact_tasks,
+        get_overdue_tasks,
+        get_task_details,
+        list_calendar_events,
+        list_projects_tool,
+        list_tasks,
+        mood_summary,
+        read_note_tool,
+        run_python_code,
+        save_bookmark,
+        search_notes_tool,
+        search_tasks_tool,
+        set_reminder,
+        show_contacts,
+        show_gifts_for_contact,
+        show_list,
+        show_mood_history,
+        show_profile,
+        show_project,
+        update_contact_tool,
+        update_note_tool,
+        web_search,
+    )
 
-def build_team_members() -> list[Agent]:
-    """Build the list of Agno Agent members for the Team."""
     return [
         Agent(
             name="researcher",
             role="Deep web research: search, fetch pages, compare prices, find news and updates",
-            model=_model("gpt-5.2"),
+            model=get_model("gpt-5.2", loop),
             tools=[web_search, fetch_url, run_python_code, save_bookmark],
             instructions="""\
 You are a research specialist for a personal assistant called Minion.
@@ -83,7 +112,7 @@ Reply in English.""",
         Agent(
             name="planner",
             role="Weekly/daily planning, task prioritization, schedule optimization",
-            model=_model("gpt-5.2"),
+            model=get_model("gpt-5.2", loop),
             tools=[
                 list_tasks,
                 get_task_details,
@@ -129,7 +158,7 @@ Reply in English.""",
         Agent(
             name="content-creator",
             role="Draft notes, lesson plans, checklists, templates, summaries, and written content",
-            model=_model("gpt-5.2"),
+            model=get_model("gpt-5.2", loop),
             tools=[
                 browse_notes,
                 read_note_tool,
@@ -165,7 +194,7 @@ Reply in English.""",
         Agent(
             name="shopping-scout",
             role="Product research, price comparison, deal finding, availability checking",
-            model=_model("gpt-5-mini"),
+            model=get_model("gpt-5-mini", loop),
             tools=[
                 show_list,
                 web_search,
@@ -201,7 +230,7 @@ Reply in English.""",
         Agent(
             name="social-manager",
             role="Birthday preparation, gift brainstorming, contact context, relationship management",
-            model=_model("gpt-5-mini"),
+            model=get_model("gpt-5-mini", loop),
             tools=[
                 show_contacts,
                 get_contact_tasks,
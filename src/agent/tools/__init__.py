@@ -1,6 +1,126 @@
 from datetime import datetime
+from typing import TYPE_CHECKING
 
 from src.config import settings
+from src.utils import format_long_date
+
+if TYPE_CHECKING:
+    from .agenda import get_agenda
+
+    # Phase 4: Autonomous Proactive Agent tools
+    from .beads import beads_create, beads_list, beads_ready
+    from .bookmarks import (
+        list_reading_list,
+        mark_read,
+        remove_bookmark,
+        save_bookmark,
+        search_reading_list,
+    )
+    from .calendar import (
+        create_calendar_event,
+        delete_calendar_event,
+        list_calendar_events,
+        test_calendar,
+        update_calendar_event,
+    )
+    from .code import run_python_code, run_shell_command
+    from .contacts import (
+        add_contact,
+        get_contact_tasks,
+        remove_contact,
+        show_contacts,
+        upcoming_birthdays,
+        update_contact_tool,
+    )
+    from .ffmpeg import (
+        add_audio,
+        add_text_overlay,
+        concat_videos,
+        extract_audio,
+        probe_media,
+        resize_video,
+        speed_video,
+        trim_video,
+    )
+    from .files import send_file
+    from .heartbeat_tools import (
+        check_dedup,
+        delegate_research,
+        delegate_task_work,
+        log_heartbeat_action,
+        send_proactive_notification,
+        task_nudge_dedup_key,
+    )
+    from .interests import (
+        add_interest,
+        list_interests,
+        remove_interest,
+        update_interest_tool,
+    )
+    from .media import edit_image, generate_image, generate_video
+    from .memory import forget_memory, list_memories, recall_memory, save_memory
+    from .mood import log_mood, mood_summary, show_mood_history
+    from .notes import (
+        append_to_note_tool,
+        browse_notes,
+        create_note_tool,
+        read_note_tool,
+        search_notes_tool,
+        update_note_tool,
+    )
+    from .profile import get_weather, show_profile, update_profile
+    from .projects import (
+        archive_project,
+        assign_tasks_to_project,
+        assign_to_project,
+        create_project,
+        list_projects_tool,
+        move_project_tasks,
+        show_project,
+        unassign_from_project,
+        update_project,
+    )
+    from .reminders import (
+        cancel_reminder,
+        list_reminders,
+        remind_before_deadline,
+        set_reminder,
+    )
+    from .scheduling import find_free_slot
+    from .shopping import (
+        add_to_list,
+        check_item,
+        clear_checked,
+        purchase_item,
+        remove_item,
+        show_gifts_for_contact,
+        show_list,
+        uncheck_item,
+    )
+    from .skills import (
+        create_skill,
+        delete_skill,
+        find_skill,
+        list_skills,
+        read_skill,
+        update_skill,
+    )
+    from .tasks import (
+        add_subtask,
+        add_tasks,
+        complete_task,
+        delete_task_tool,
+        get_overdue_tasks,
+        get_task_details,
+        list_recurring,
+        list_tags,
+        list_tasks,
+        move_task,
+        search_tasks_tool,
+        stop_recurring,
+        update_task_tool,
+    )
+    from .web import fetch_url, web_search
 
 
 def get_current_datetime() -> str:
@@ -10,125 +130,105 @@ def get_current_datetime() -> str:
         Current datetime formatted as a human-readable string.
     """
     now = datetime.now(settings.timezone)
-    return now.strftime("%A, %B %d, %Y at %H:%M:%S %Z")
+    return f"{format_long_date(now)} at {now.hour:02d}:{now.minute:02d}:{now.second:02d} {now.tzname() or ''}"
 
 
-from .agenda import get_agenda  # noqa: E402
-
-# Phase 4: Autonomous Proactive Agent tools
-from .beads import beads_create, beads_list, beads_ready  # noqa: E402
-from .bookmarks import (  # noqa: E402
-    list_reading_list,
-    mark_read,
-    remove_bookmark,
-    save_bookmark,
-    search_reading_list,
-)
-from .calendar import (  # noqa: E402
-    create_calendar_event,
-    delete_calendar_event,
-    list_calendar_events,
-    test_calendar,
-    update_calendar_event,
-)
-from .code import run_python_code, run_shell_command  # noqa: E402
-from .contacts import (  # noqa: E402
-    add_contact,
-    get_contact_tasks,
-    remove_contact,
-    show_contacts,
-    upcoming_birthdays,
-    update_contact_tool,
-)
-from .ffmpeg import (  # noqa: E402
-    add_audio,
-    add_text_overlay,
-    concat_videos,
-    extract_audio,
-    probe_media,
-    resize_video,
-    speed_video,
-    trim_video,
-)
-from .files import send_file  # noqa: E402
-from .heartbeat_tools import (  # noqa: E402
-    check_dedup,
-    delegate_research,
-    delegate_task_work,
-    log_heartbeat_action,
-    send_proactive_notification,
-    task_nudge_dedup_key,
-)
-from .interests import (  # noqa: E402
-    add_interest,
-    list_interests,
-    remove_interest,
-    update_interest_tool,
-)
-from .media import edit_image, generate_image, generate_video  # noqa: E402
-from .memory import forget_memory, list_memories, recall_memory, save_memory  # noqa: E402
-from .mood import log_mood, mood_summary, show_mood_history  # noqa: E402
-from .notes import (  # noqa: E402
-    append_to_note_tool,
-    browse_notes,
-    create_note_tool,
-    read_note_tool,
-    search_notes_tool,
-    update_note_tool,
-)
-from .profile import get_weather, show_profile, update_profile  # noqa: E402
-from .projects import (  # noqa: E402
-    archive_project,
-    assign_tasks_to_project,
-    assign_to_project,
-    create_project,
-    list_projects_tool,
-    move_project_tasks,
-    show_project,
-    unassign_from_project,
-    update_project,
-)
-from .reminders import (  # noqa: E402
-    cancel_reminder,
-    list_reminders,
-    remind_before_deadline,
-    set_reminder,
-)
-from .scheduling import find_free_slot  # noqa: E402
-from .shopping import (  # noqa: E402
-    add_to_list,
-    check_item,
-    clear_checked,
-    purchase_item,
-    remove_item,
-    show_gifts_for_contact,
-    show_list,
-    uncheck_item,
-)
-from .skills import (  # noqa: E402
-    create_skill,
-    delete_skill,
-    find_skill,
-    list_skills,
-    read_skill,
-    update_skill,
-)
-from .tasks import (  # noqa: E402
-    add_subtask,
-    add_tasks,
-    complete_task,
-    delete_task_tool,
-    get_overdue_tasks,
-    get_task_details,
-    list_recurring,
-    list_tags,
-    list_tasks,
-    move_task,
-    search_tasks_tool,
-    stop_recurring,
-    update_task_tool,
-)
-from .web import fetch_url, web_search  # noqa: E402
+# Submodule -> exported tool names. Submodules are imported on first attribute
+# access (PEP 562), so importing one tool doesn't load every integration.
+_SUBMODULE_EXPORTS: dict[str, tuple[str, ...]] = {
+    "agenda": ("get_agenda",),
+    "beads": ("beads_create", "beads_list", "beads_ready"),
+    "bookmarks": ("list_reading_list", "mark_read", "remove_bookmark", "save_bookmark", "search_reading_list"),
+    "calendar": (
+        "create_calendar_event",
+        "delete_calendar_event",
+        "list_calendar_events",
+        "test_calendar",
+        "update_calendar_event",
+    ),
+    "code": ("run_python_code", "run_shell_command"),
+    "contacts": (
+        "add_contact",
+        "get_contact_tasks",
+        "remove_contact",
+        "show_contacts",
+        "upcoming_birthdays",
+        "update_contact_tool",
+    ),
+    "ffmpeg": (
+        "add_audio",
+        "add_text_overlay",
+        "concat_videos",
+        "extract_audio",
+        "probe_media",
+        "resize_video",
+        "speed_video",
+        "trim_video",
+    ),
+    "files": ("send_file",),
+    "heartbeat_tools": (
+        "check_dedup",
+        "delegate_research",
+        "delegate_task_work",
+        "log_heartbeat_action",
+        "send_proactive_notification",
+        "task_nudge_dedup_key",
+    ),
+    "interests": ("add_interest", "list_interests", "remove_interest", "update_interest_tool"),
+    "media": ("edit_image", "generate_image", "generate_video"),
+    "memory": ("forget_memory", "list_memories", "recall_memory", "save_memory"),
+    "mood": ("log_mood", "mood_summary", "show_mood_history"),
+    "notes": (
+        "append_to_note_tool",
+        "browse_notes",
+        "create_note_tool",
+        "read_note_tool",
+        "search_notes_tool",
+        "update_note_tool",
+    ),
+    "profile": ("get_weather", "show_profile", "update_profile"),
+    "projects": (
+        "archive_project",
+        "assign_tasks_to_project",
+        "assign_to_project",
+        "create_project",
+        "list_projects_tool",
+        "move_project_tasks",
+        "show_project",
+        "unassign_from_project",
+        "update_project",
+    ),
+    "reminders": ("cancel_reminder", "list_reminders", "remind_before_deadline", "set_reminder"),
+    "scheduling": ("find_free_slot",),
+    "shopping": (
+        "add_to_list",
+        "check_item",
+        "clear_checked",
+        "purchase_item",
+        "remove_item",
+        "show_gifts_for_contact",
+        "show_list",
+        "uncheck_item",
+    ),
+    "skills": ("create_skill", "delete_skill", "find_skill", "list_skills", "read_skill", "update_skill"),
+    "tasks": (
+        "add_subtask",
+        "add_tasks",
+        "complete_task",
+        "delete_task_tool",
+        "get_overdue_tasks",
+        "get_task_details",
+        "list_recurring",
+        "list_tags",
+        "list_tasks",
+        "move_task",
+        "search_tasks_tool",
+        "stop_recurring",
+        "update_task_tool",
+    ),
+    "web": ("fetch_url", "web_search"),
+}
+_ATTR_TO_MODULE = {name: module for module, names in _SUBMODULE_EXPORTS.items() for name in names}
 
 __all__ = [
     "get_current_datetime",
@@ -255,3 +355,18 @@ __all__ = [
     "update_skill",
     "delete_skill",
 ]
+
+
+def __getattr__(name: str):
+    module = _ATTR_TO_MODULE.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
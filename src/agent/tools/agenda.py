@@ -1,7 +1,13 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from itertools import chain
+
+from sqlalchemy.orm import Session
 
 from src.config import settings
-from src.db import session_scope
+from src.db import listen_session_event, session_scope
+from src.db.models import CalendarEvent, Contact, Project, Reminder, Task, UserProfile
 from src.db.queries import (
     count_backlog_tasks,
     get_user_profile,
@@ -11,7 +17,61 @@ from src.db.queries import (
     list_tasks_due_on_date,
 )
 from src.integrations.weather import fetch_weather, format_weather
-from src.utils import parse_date
+from src.utils import days_overdue, parse_date
+
+# Weather is network-bound and independent of the DB work, so it runs alongside it
+_weather_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="agenda-weather")
+
+# Rendered agendas keyed by day, reused for a short TTL so repeated calls within a
+# turn don't redo the queries. Any write to a model the agenda renders (including
+# the contact names and project emoji shown next to tasks) clears the cache.
+_AGENDA_TTL_SECONDS = 30.0
+_AGENDA_MODELS = (Task, Reminder, CalendarEvent, UserProfile, Project, Contact)
+_agenda_cache: dict[datetime, tuple[float, str]] = {}
+_agenda_generation = 0  # bumped on every invalidation so an in-flight build isn't cached stale
+
+
+def _invalidate_agenda_cache() -> None:
+    global _agenda_generation
+    _agenda_generation += 1
+    _agenda_cache.clear()
+
+
+def _mark_if_agenda_touched(session: Session, _flush_context) -> None:
+    if any(isinstance(obj, _AGENDA_MODELS) for obj in chain(session.new, session.dirty, session.deleted)):
+        session.info["agenda_dirty"] = True
+
+
+def _mark_on_bulk_write(orm_execute_state) -> None:
+    # Bulk INSERT/UPDATE/DELETE statements bypass the flush
+    if not orm_execute_state.is_select:
+        orm_execute_state.session.info["agenda_dirty"] = True
+
+
+def _invalidate_after_commit(session: Session) -> None:
+    # Clear only once the write is visible; clearing at flush time would let a
+    # concurrent reader re-cache the pre-commit snapshot.
+    if session.info.pop("agenda_dirty", False):
+        _invalidate_agenda_cache()
+
+
+def _discard_on_rollback(session: Session, _previous_transaction=None) -> None:
+    session.info.pop("agenda_dirty", None)
+
+
+listen_session_event("after_flush", _mark_if_agenda_touched)
+listen_session_event("do_orm_execute", _mark_on_bulk_write)
+listen_session_event("after_commit", _invalidate_after_commit)
+listen_session_event("after_rollback", _discard_on_rollback)
+
+
+def _hhmm(dt: datetime) -> str:
+    """Same as dt.strftime("%H:%M"), without going through strftime."""
+    return f"{dt.hour:02d}:{dt.minute:02d}"
+
+
+def _project_prefix(task: Task) -> str:
+    return task.project.emoji + " " if task.project else ""
 
 
 def get_agenda(date: str | None = None) -> str:
@@ -23,45 +83,49 @@ def get_agenda(date: str | None = None) -> str:
     Returns:
         Formatted agenda with tasks due, calendar events, and reminders for the day.
     """
-    if date:
-        parsed = parse_date(date)
-        target_date = parsed.replace(tzinfo=settings.timezone) if parsed else datetime.now(settings.timezone)
-    else:
-        target_date = datetime.now(settings.timezone)
+    now = datetime.now(settings.timezone).replace(tzinfo=None)
+    parsed = parse_date(date) if date else None
+    target_date = parsed or now
+
+    day_start = target_date.replace(hour=0, minute=0, second=0, microsecond=0, tzinfo=None)
+    cached = _agenda_cache.get(day_start)
+    if cached is not None and time.monotonic() - cached[0] < _AGENDA_TTL_SECONDS:
+        return cached[1]
+
+    generation = _agenda_generation
+    agenda = _build_agenda(day_start, now)
+    if generation == _agenda_generation:
+        _agenda_cache[day_start] = (time.monotonic(), agenda)
+    return agenda
 
-    day_start = target_date.replace(hour=0, minute=0, second=0, microsecond=0)
+
+def _build_agenda(day_start: datetime, now: datetime) -> str:
     day_end = day_start + timedelta(days=1)
 
     with session_scope() as session:
+        # Start the weather round-trip first so it overlaps with the DB queries below
+        profile = get_user_profile(session)
+        weather_future = None
+        if profile and profile.latitude and profile.longitude:
+            weather_future = _weather_executor.submit(fetch_weather, profile.latitude, profile.longitude)
+
         # Targeted queries instead of loading all tasks
-        now = datetime.now(settings.timezone).replace(tzinfo=None)
-        tasks_due = list_tasks_due_on_date(
-            session,
-            day_start.replace(tzinfo=None),
-            day_end.replace(tzinfo=None),
-        )
-        overdue_tasks = list_overdue_tasks(session, day_start.replace(tzinfo=None))
+        tasks_due = list_tasks_due_on_date(session, day_start, day_end)
+        overdue_tasks = list_overdue_tasks(session, day_start)
         backlog_count = count_backlog_tasks(session)
 
         # Get calendar events
-        events = list_calendar_events_range(
-            session,
-            day_start.replace(tzinfo=None),
-            day_end.replace(tzinfo=None),
-        )
+        events = list_calendar_events_range(session, day_start, day_end)
 
         # Get reminders for today
-        reminders = list_pending_reminders(session, day_end.replace(tzinfo=None))
-        today_reminders = [r for r in reminders if r.remind_at >= day_start.replace(tzinfo=None)]
+        today_reminders = list_pending_reminders(session, day_end, after=day_start)
 
         # Weather
-        profile = get_user_profile(session)
         weather_line = None
-        if profile and profile.latitude and profile.longitude:
-            data = fetch_weather(profile.latitude, profile.longitude)
-            if data:
-                city = profile.city or ""
-                weather_line = f"{format_weather(data)} | {city}" if city else format_weather(data)
+        data = weather_future.result() if weather_future else None
+        if data:
+            city = profile.city or ""
+            weather_line = f"{format_weather(data)} | {city}" if city else format_weather(data)
 
         # Format output while session is still open (to access relationships)
         lines = []
@@ -73,19 +137,16 @@ def get_agenda(date: str | None = None) -> str:
         # Overdue tasks (show first!)
         if overdue_tasks:
             lines.append("OVERDUE")
-            for task in overdue_tasks:
-                project_emoji = task.project.emoji + " " if task.project else ""
-                days_overdue = (now - task.due_date).days if task.due_date else 0
-                lines.append(f"  #{task.id} {project_emoji}{task.title} ({days_overdue}d overdue)")
+            lines.extend(
+                f"  #{task.id} {_project_prefix(task)}{task.title} ({days_overdue(task.due_date, now)}d overdue)"
+                for task in overdue_tasks
+            )
             lines.append("")
 
         # Calendar events
         if events:
             lines.append("Events")
-            for event in events:
-                time_str = event.start_time.strftime("%H:%M")
-                end_str = event.end_time.strftime("%H:%M")
-                lines.append(f"  {time_str}-{end_str}  {event.title}")
+            lines.extend(f"  {_hhmm(event.start_time)}-{_hhmm(event.end_time)}  {event.title}" for event in events)
         else:
             lines.append("No calendar events")
 
@@ -93,10 +154,10 @@ def get_agenda(date: str | None = None) -> str:
         lines.append("")
         if tasks_due:
             lines.append("Due Today")
-            for task in tasks_due:
-                project_emoji = task.project.emoji + " " if task.project else ""
-                contact_info = f" {task.contact.name}" if task.contact else ""
-                lines.append(f"  #{task.id} {project_emoji}{task.title}{contact_info}")
+            lines.extend(
+                f"  #{task.id} {_project_prefix(task)}{task.title}{f' {task.contact.name}' if task.contact else ''}"
+                for task in tasks_due
+            )
         else:
             lines.append("No tasks due today")
 
@@ -104,9 +165,7 @@ def get_agenda(date: str | None = None) -> str:
         if today_reminders:
             lines.append("")
             lines.append("Reminders")
-            for rem in today_reminders:
-                time_str = rem.remind_at.strftime("%H:%M")
-                lines.append(f"  {time_str} #{rem.id} {rem.message}")
+            lines.extend(f"  {_hhmm(rem.remind_at)} #{rem.id} {rem.message}" for rem in today_reminders)
 
         # Pending tasks (backlog)
         if backlog_count > 0:
@@ -1,16 +1,28 @@
 """Beads CLI fallback tools — for when MCP isn't running or for synchronous contexts."""
 
 import logging
+import shutil
 import subprocess
 
 logger = logging.getLogger(__name__)
 
 
+_bd_path: str | None = None
+
+
+def _bd_executable() -> str:
+    """Resolve bd once it's found; until then fall back to the bare name (retried each call)."""
+    global _bd_path
+    if _bd_path is None:
+        _bd_path = shutil.which("bd")
+    return _bd_path or "bd"
+
+
 def _run_bd(args: list[str]) -> str:
     """Run a bd CLI command and return output."""
     try:
         result = subprocess.run(
-            ["bd"] + args,
+            [_bd_executable(), *args],
             capture_output=True,
             text=True,
             timeout=30,
@@ -5,6 +5,7 @@ from src.db import session_scope
 from src.db.queries import (
     create_contact,
     delete_contact,
+    find_contacts_by_name,
     get_contact,
     get_task_counts_by_contacts,
     get_tasks_by_contact,
@@ -160,19 +161,33 @@ def update_contact_tool(
         return f"Updated contact #{contact_id}: {contact.name}"
 
 
-def remove_contact(contact_id: int) -> str:
-    """Remove a contact. DESTRUCTIVE - call show_contacts first to verify the ID!
+def remove_contact(contact_id: int | None = None, name: str | None = None) -> str:
+    """Remove a contact by ID, or by exact name. DESTRUCTIVE - never guess IDs!
 
     Args:
-        contact_id: The ID of the contact. MUST call show_contacts first to verify correct ID.
+        contact_id: The ID of the contact, as shown by show_contacts.
+        name: Exact contact name (case-insensitive), used when contact_id is not given.
+              Removes only if exactly one contact matches; otherwise lists the matches.
 
     Returns:
         Confirmation message or error.
     """
     with session_scope() as session:
-        contact = get_contact(session, contact_id)
-        if not contact:
-            return f"Contact #{contact_id} not found."
+        if contact_id is None:
+            if not name:
+                return "Provide a contact_id or name."
+            matches = find_contacts_by_name(session, name)
+            if not matches:
+                return f"No contact named '{name}' found."
+            if len(matches) > 1:
+                listed = "\n".join(f"#{c.id}: {c.name}" for c in matches)
+                return f"Multiple contacts named '{name}', nothing removed. Retry with contact_id:\n{listed}"
+            contact = matches[0]
+            contact_id = contact.id
+        else:
+            contact = get_contact(session, contact_id)
+            if not contact:
+                return f"Contact #{contact_id} not found."
 
         name = contact.name
         success = delete_contact(session, contact_id)
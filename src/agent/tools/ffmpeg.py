@@ -5,9 +5,11 @@ import subprocess
 import time
 from pathlib import Path
 
+from src.config import settings
+
 logger = logging.getLogger(__name__)
 
-MEDIA_DIR = Path("data/media")
+MEDIA_DIR = settings.media_dir
 _TIMEOUT = 300  # 5 minutes max per ffmpeg operation
 
 
@@ -18,6 +18,9 @@ from src.notifications import notify
 
 logger = logging.getLogger(__name__)
 
+# Strong references to in-flight notification tasks (the loop only keeps weak ones)
+_background_tasks: set[asyncio.Task[None]] = set()
+
 
 def _is_quiet_hours() -> bool:
     """Check if current time is within quiet hours (before work_start_hour)."""
@@ -147,11 +150,13 @@ def send_proactive_notification(message: str) -> str:
         logger.info(f"Suppressed duplicate task nudge for tasks {task_ids}")
         return f"Suppressed duplicate task nudge — tasks {task_ids} already nudged in last 24h."
 
+    coro = notify(message)
     try:
-        loop = asyncio.get_running_loop()
-        loop.create_task(notify(message))
+        task = asyncio.create_task(coro)
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
     except RuntimeError:
-        asyncio.run(notify(message))
+        asyncio.run(coro)
     except Exception as e:
         return f"Failed to send notification: {e}"
 
@@ -5,6 +5,7 @@ from src.db.queries import (
     get_task,
     list_all_reminders,
 )
+from src.services.reminders import ensure_deadline_reminder
 from src.utils import parse_date
 
 
@@ -92,8 +93,6 @@ def remind_before_deadline(task_id: int, hours_before: float = 1.0) -> str:
     Returns:
         Confirmation message or error.
     """
-    from src.services.reminders import ensure_deadline_reminder
-
     with session_scope() as session:
         task = get_task(session, task_id)
         if not task:
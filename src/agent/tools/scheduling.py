@@ -37,7 +37,8 @@ def find_free_slot(
             if profile.work_end_hour is not None:
                 work_end = profile.work_end_hour
 
-    now = datetime.now(settings.timezone)
+    tz = settings.timezone
+    now = datetime.now(tz)
     # Start from next hour boundary
     start_search = now.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
     end_search = now + timedelta(days=days_ahead)
@@ -62,8 +63,8 @@ def find_free_slot(
         b_start = datetime.fromisoformat(period["start"].replace("Z", "+00:00"))
         b_end = datetime.fromisoformat(period["end"].replace("Z", "+00:00"))
         # Convert to local timezone
-        b_start = b_start.astimezone(settings.timezone)
-        b_end = b_end.astimezone(settings.timezone)
+        b_start = b_start.astimezone(tz)
+        b_end = b_end.astimezone(tz)
         busy.append((b_start, b_end))
 
     busy.sort(key=lambda x: x[0])
@@ -75,8 +76,8 @@ def find_free_slot(
 
     while current_day <= end_day and len(slots) < 5:
         # Work window for this day
-        day_start = datetime(current_day.year, current_day.month, current_day.day, work_start, tzinfo=settings.timezone)
-        day_end = datetime(current_day.year, current_day.month, current_day.day, work_end, tzinfo=settings.timezone)
+        day_start = datetime(current_day.year, current_day.month, current_day.day, work_start, tzinfo=tz)
+        day_end = datetime(current_day.year, current_day.month, current_day.day, work_end, tzinfo=tz)
 
         # Skip past times for today
         if day_start < now:
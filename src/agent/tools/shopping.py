@@ -8,6 +8,7 @@ from src.db.queries import (
     clear_checked_items,
     create_shopping_item,
     delete_shopping_item,
+    find_shopping_items_by_name,
     get_contact_by_name,
     get_gifts_by_contact,
     get_shopping_item,
@@ -271,20 +272,33 @@ def uncheck_item(item_id: int) -> str:
         return f"Failed to uncheck item #{item_id}."
 
 
-def remove_item(item_id: int) -> str:
-    """Remove an item from a shopping list.
+def remove_item(item_id: int | None = None, name: str | None = None) -> str:
+    """Remove an item from a shopping list by ID, or by its exact name.
 
     Args:
         item_id: The database ID of the item (shown as #N in show_list). Must be >= 1.
-                 Call show_list first if you don't know the ID.
+        name: Exact item name (case-insensitive), used when item_id is not given.
+              Removes only if exactly one item matches; otherwise lists the matches.
 
     Returns:
         Confirmation message or error.
     """
     with session_scope() as session:
-        item = get_shopping_item(session, item_id)
-        if not item:
-            return f"Item #{item_id} not found."
+        if item_id is None:
+            if not name:
+                return "Provide an item_id or name."
+            matches = find_shopping_items_by_name(session, name)
+            if not matches:
+                return f"No item named '{name}' found."
+            if len(matches) > 1:
+                listed = "\n".join(f"#{i.id}: {i.name} ({i.shopping_list.list_type.value})" for i in matches)
+                return f"Multiple items named '{name}', nothing removed. Retry with item_id:\n{listed}"
+            item = matches[0]
+            item_id = item.id
+        else:
+            item = get_shopping_item(session, item_id)
+            if not item:
+                return f"Item #{item_id} not found."
 
         name = item.name
         success = delete_shopping_item(session, item_id)
@@ -1,16 +1,20 @@
 from datetime import datetime
 
+from sqlalchemy import select
+
 from src.config import settings
 from src.db import session_scope
 from src.db.models import Task, TaskPriority, TaskStatus
 from src.db.queries import (
     create_task,
     delete_task,
+    find_tasks_by_title,
     get_contact_by_name,
     get_project_by_name,
     get_subtasks,
     get_task,
     list_attachments_by_task,
+    list_overdue_tasks,
     list_tasks_by_status,
     search_tasks,
     update_task,
@@ -18,6 +22,7 @@ from src.db.queries import (
 from src.db.queries import (
     list_projects as db_list_projects,
 )
+from src.services.reminders import ensure_deadline_reminder
 from src.utils import format_date, parse_date
 
 
@@ -91,8 +96,6 @@ def add_tasks(tasks: list[dict]) -> str:
             created_ids.append(task.id)
 
             if task.due_date:
-                from src.services.reminders import ensure_deadline_reminder
-
                 ensure_deadline_reminder(session, task)
 
     if len(created_ids) == 1:
@@ -161,8 +164,6 @@ def update_task_tool(
             return f"Task <code>#{task_id}</code> not found"
 
         if due_date is not None and task.due_date:
-            from src.services.reminders import ensure_deadline_reminder
-
             ensure_deadline_reminder(session, task)
 
         return f"Updated <code>#{task_id}</code> <i>{task.title}</i>"
@@ -192,8 +193,6 @@ def get_overdue_tasks() -> str:
     Returns:
         Formatted list of overdue tasks or message if none.
     """
-    from src.db.queries import list_overdue_tasks
-
     with session_scope() as session:
         now = datetime.now(settings.timezone).replace(tzinfo=None)
         tasks = list_overdue_tasks(session, now)
@@ -372,16 +371,29 @@ def get_task_details(task_id: int) -> str:
         return "\n".join(lines)
 
 
-def delete_task_tool(task_id: int) -> str:
-    """Delete a task.
+def delete_task_tool(task_id: int | None = None, name: str | None = None) -> str:
+    """Delete a task by ID, or by its exact title.
 
     Args:
         task_id: The ID of the task to delete.
+        name: Exact task title (case-insensitive), used when task_id is not given.
+              Deletes only if exactly one task matches; otherwise lists the matches.
 
     Returns:
         Confirmation message or error if task not found.
     """
     with session_scope() as session:
+        if task_id is None:
+            if not name:
+                return "Provide a task_id or name."
+            matches = find_tasks_by_title(session, name)
+            if not matches:
+                return f"No task titled '{name}' found."
+            if len(matches) > 1:
+                listed = "\n".join(f"#{t.id}: {t.title} ({t.status.value})" for t in matches)
+                return f"Multiple tasks titled '{name}', nothing deleted. Retry with task_id:\n{listed}"
+            task_id = matches[0].id
+
         success = delete_task(session, task_id)
 
         if success:
@@ -508,17 +520,13 @@ def list_recurring() -> str:
         Formatted list of recurring tasks with their recurrence rules.
     """
     with session_scope() as session:
-        from sqlalchemy import select
-
-        from src.db.models import Task as TaskModel
-
         stmt = (
-            select(TaskModel)
+            select(Task)
             .where(
-                TaskModel.recurrence_rule.isnot(None),
-                TaskModel.status.in_([TaskStatus.TODO, TaskStatus.IN_PROGRESS]),
+                Task.recurrence_rule.isnot(None),
+                Task.status.in_([TaskStatus.TODO, TaskStatus.IN_PROGRESS]),
             )
-            .order_by(TaskModel.created_at.desc())
+            .order_by(Task.created_at.desc())
         )
         tasks = session.scalars(stmt).all()
 
@@ -16,6 +16,7 @@ class Settings:
     google_credentials_path: Path
     google_token_path: Path
     database_path: Path
+    media_dir: Path
     timezone: ZoneInfo
     # Web server settings for OAuth
     web_host: str
@@ -29,6 +30,8 @@ class Settings:
     # AI model names (kept for vision/voice/heartbeat display, not used by main agent)
     agent_model: str
     vision_model: str
+    # Cheap model for background work: memory extraction, session summaries
+    memory_model: str
     # Reminder defaults
     default_reminder_offset_hours: float
     # Code execution
@@ -62,6 +65,7 @@ class Settings:
         google_credentials_path = Path(os.environ.get("GOOGLE_CREDENTIALS_PATH", "credentials/google_credentials.json"))
         google_token_path = Path(os.environ.get("GOOGLE_TOKEN_PATH", "credentials/google_token.json"))
         database_path = Path(os.environ.get("DATABASE_PATH", "data/minion.db"))
+        media_dir = Path(os.environ.get("MEDIA_DIR", "data/media"))
 
         tz_name = os.environ.get("TIMEZONE", "America/Sao_Paulo")
         timezone = ZoneInfo(tz_name)
@@ -79,6 +83,7 @@ class Settings:
 
         agent_model = os.environ.get("AGENT_MODEL", "gpt-5.2")
         vision_model = os.environ.get("VISION_MODEL", "gpt-5.2")
+        memory_model = os.environ.get("MEMORY_MODEL", "gpt-5-mini")
 
         default_reminder_offset_hours = float(os.environ.get("DEFAULT_REMINDER_OFFSET_HOURS", "1.0"))
 
@@ -110,6 +115,7 @@ class Settings:
             google_credentials_path=google_credentials_path,
             google_token_path=google_token_path,
             database_path=database_path,
+            media_dir=media_dir,
             timezone=timezone,
             web_host=web_host,
             web_port=web_port,
@@ -119,6 +125,7 @@ class Settings:
             silverbullet_space_path=silverbullet_space_path,
             agent_model=agent_model,
             vision_model=vision_model,
+            memory_model=memory_model,
             default_reminder_offset_hours=default_reminder_offset_hours,
             code_execution_timeout=code_execution_timeout,
             heartbeat_interval_minutes=heartbeat_interval_minutes,
@@ -2,13 +2,15 @@ from collections.abc import Generator
 from contextlib import contextmanager
 from pathlib import Path
 
-from sqlalchemy import create_engine
+from sqlalchemy import Engine, create_engine, event
 from sqlalchemy.orm import Session, sessionmaker
 
 from .models import Base
 
 _engine = None
-_SessionLocal = None
+# Created unbound so app-level session listeners can be attached before
+# init_database() binds it; only sessions from here (not Agno's) see them.
+_SessionLocal = sessionmaker()
 
 
 @contextmanager
@@ -32,31 +34,67 @@ def session_scope() -> Generator[Session, None, None]:
         session.close()
 
 
+def _set_sqlite_pragmas(dbapi_connection, _connection_record) -> None:
+    """Tune each new SQLite connection.
+
+    WAL lets readers (system prompt, dashboard) proceed while the agent's session
+    store writes. synchronous=NORMAL is safe under WAL and skips the per-commit
+    fsync; busy_timeout makes a writer wait for the lock instead of failing.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA busy_timeout=5000")
+    cursor.close()
+
+
+def _casefold(value: str | None) -> str | None:
+    return value.casefold() if isinstance(value, str) else value
+
+
+def _register_sqlite_functions(dbapi_connection, _connection_record) -> None:
+    """Expose Python's Unicode-aware casefold() to SQL.
+
+    SQLite's lower() and LIKE only fold ASCII, so "Água" would not match "água".
+    """
+    dbapi_connection.create_function("casefold", 1, _casefold, deterministic=True)
+
+
+def configure_sqlite_engine(engine: Engine) -> None:
+    """Apply the connection pragmas and SQL helper functions to every connection the engine opens."""
+    event.listen(engine, "connect", _set_sqlite_pragmas)
+    event.listen(engine, "connect", _register_sqlite_functions)
+
+
 def init_database(database_path: Path) -> None:
-    global _engine, _SessionLocal
+    global _engine
 
     database_path.parent.mkdir(parents=True, exist_ok=True)
     database_url = f"sqlite:///{database_path}"
 
-    _engine = create_engine(database_url)
+    # The app issues well over a hundred distinct statements; the sqlite3 default of
+    # 128 cached prepared statements would keep evicting hot queries.
+    _engine = create_engine(database_url, connect_args={"cached_statements": 256})
+    configure_sqlite_engine(_engine)
     Base.metadata.create_all(_engine)
-    _SessionLocal = sessionmaker(bind=_engine)
+    _SessionLocal.configure(bind=_engine)
 
-    # Run pending migrations
+    # Run pending migrations and seed defaults in a single transaction
     from .migrations import run_migrations
-
-    with session_scope() as session:
-        run_migrations(session)
-
-    # Seed default projects and shopping lists
     from .queries import seed_default_projects, seed_default_shopping_lists
 
     with session_scope() as session:
+        run_migrations(session)
         seed_default_projects(session)
         seed_default_shopping_lists(session)
 
 
+def listen_session_event(identifier: str, fn) -> None:
+    """Register a SQLAlchemy session event listener on the app's sessions only."""
+    event.listen(_SessionLocal, identifier, fn)
+
+
 def get_session() -> Session:
-    if _SessionLocal is None:
+    if _engine is None:
         raise RuntimeError("Database not initialized. Call init_database first.")
     return _SessionLocal()
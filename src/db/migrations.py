@@ -27,10 +27,9 @@ def _ensure_migrations_table(session: Session) -> None:
     session.flush()
 
 
-def _is_applied(session: Session, migration_id: str) -> bool:
-    """Check if a migration has been applied."""
-    result = session.execute(text("SELECT 1 FROM _migrations WHERE id = :id"), {"id": migration_id}).fetchone()
-    return result is not None
+def _applied_ids(session: Session) -> set[str]:
+    """Return the IDs of all migrations already applied."""
+    return set(session.execute(text("SELECT id FROM _migrations")).scalars())
 
 
 def _mark_applied(session: Session, migration_id: str) -> None:
@@ -42,18 +41,31 @@ def _mark_applied(session: Session, migration_id: str) -> None:
     session.flush()
 
 
+def _table_exists(session: Session, table: str) -> bool:
+    """Check if a table exists (SQLite-specific)."""
+    result = session.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type='table' AND name = :name"), {"name": table}
+    ).fetchone()
+    return result is not None
+
+
+def _table_columns(session: Session, table: str) -> set[str]:
+    """Return the set of column names for a table (SQLite-specific)."""
+    return {row[1] for row in session.execute(text(f"PRAGMA table_info({table})"))}
+
+
 def _column_exists(session: Session, table: str, column: str) -> bool:
     """Check if a column exists in a table (SQLite-specific)."""
-    result = session.execute(text(f"PRAGMA table_info({table})")).fetchall()
-    return any(row[1] == column for row in result)
+    return column in _table_columns(session, table)
 
 
 def run_migrations(session: Session) -> None:
     """Run all pending migrations."""
     _ensure_migrations_table(session)
+    applied = _applied_ids(session)
 
     for migration_id, description, migrate_fn in MIGRATIONS:
-        if _is_applied(session, migration_id):
+        if migration_id in applied:
             continue
 
         logger.info(f"Running migration {migration_id}: {description}")
@@ -103,9 +115,10 @@ MIGRATIONS.append(
 
 def _003_add_shopping_quantities(session: Session) -> None:
     """Add quantity columns to shopping_items (from migrate_shopping_quantities.py)."""
-    if not _column_exists(session, "shopping_items", "quantity_target"):
+    columns = _table_columns(session, "shopping_items")
+    if "quantity_target" not in columns:
         session.execute(text("ALTER TABLE shopping_items ADD COLUMN quantity_target INTEGER DEFAULT 1"))
-    if not _column_exists(session, "shopping_items", "quantity_purchased"):
+    if "quantity_purchased" not in columns:
         session.execute(text("ALTER TABLE shopping_items ADD COLUMN quantity_purchased INTEGER DEFAULT 0"))
     session.flush()
 
@@ -121,11 +134,7 @@ MIGRATIONS.append(
 
 def _004_add_user_projects(session: Session) -> None:
     """Add user_projects table and FK (from migrate_user_projects.py)."""
-    # Check if user_projects table exists
-    result = session.execute(
-        text("SELECT name FROM sqlite_master WHERE type='table' AND name='user_projects'")
-    ).fetchone()
-    if not result:
+    if not _table_exists(session, "user_projects"):
         session.execute(
             text("""
             CREATE TABLE user_projects (
@@ -184,10 +193,7 @@ MIGRATIONS.append(
 
 def _006_add_user_profile(session: Session) -> None:
     """Add user_profiles table."""
-    result = session.execute(
-        text("SELECT name FROM sqlite_master WHERE type='table' AND name='user_profiles'")
-    ).fetchone()
-    if not result:
+    if not _table_exists(session, "user_profiles"):
         session.execute(
             text("""
             CREATE TABLE user_profiles (
@@ -218,9 +224,10 @@ MIGRATIONS.append(
 
 def _007_add_recurring_tasks(session: Session) -> None:
     """Add recurrence columns to tasks table."""
-    if not _column_exists(session, "tasks", "recurrence_rule"):
+    columns = _table_columns(session, "tasks")
+    if "recurrence_rule" not in columns:
         session.execute(text("ALTER TABLE tasks ADD COLUMN recurrence_rule VARCHAR(255)"))
-    if not _column_exists(session, "tasks", "recurrence_source_id"):
+    if "recurrence_source_id" not in columns:
         session.execute(text("ALTER TABLE tasks ADD COLUMN recurrence_source_id INTEGER REFERENCES tasks(id)"))
     session.flush()
 
@@ -236,8 +243,7 @@ MIGRATIONS.append(
 
 def _008_add_bookmarks(session: Session) -> None:
     """Add bookmarks table."""
-    result = session.execute(text("SELECT name FROM sqlite_master WHERE type='table' AND name='bookmarks'")).fetchone()
-    if not result:
+    if not _table_exists(session, "bookmarks"):
         session.execute(
             text("""
             CREATE TABLE bookmarks (
@@ -268,8 +274,7 @@ MIGRATIONS.append(
 
 def _009_add_mood_logs(session: Session) -> None:
     """Add mood_logs table."""
-    result = session.execute(text("SELECT name FROM sqlite_master WHERE type='table' AND name='mood_logs'")).fetchone()
-    if not result:
+    if not _table_exists(session, "mood_logs"):
         session.execute(
             text("""
             CREATE TABLE mood_logs (
@@ -296,10 +301,7 @@ MIGRATIONS.append(
 
 def _010_add_web_sessions(session: Session) -> None:
     """Add web_sessions table."""
-    result = session.execute(
-        text("SELECT name FROM sqlite_master WHERE type='table' AND name='web_sessions'")
-    ).fetchone()
-    if not result:
+    if not _table_exists(session, "web_sessions"):
         session.execute(
             text("""
             CREATE TABLE web_sessions (
@@ -342,10 +344,7 @@ MIGRATIONS.append(
 
 def _012_add_user_interests(session: Session) -> None:
     """Add user_interests table."""
-    result = session.execute(
-        text("SELECT name FROM sqlite_master WHERE type='table' AND name='user_interests'")
-    ).fetchone()
-    if not result:
+    if not _table_exists(session, "user_interests"):
         session.execute(
             text("""
             CREATE TABLE user_interests (
@@ -375,10 +374,7 @@ MIGRATIONS.append(
 
 def _013_add_heartbeat_logs(session: Session) -> None:
     """Add heartbeat_logs table."""
-    result = session.execute(
-        text("SELECT name FROM sqlite_master WHERE type='table' AND name='heartbeat_logs'")
-    ).fetchone()
-    if not result:
+    if not _table_exists(session, "heartbeat_logs"):
         session.execute(
             text("""
             CREATE TABLE heartbeat_logs (
@@ -651,3 +647,66 @@ MIGRATIONS.append(
         _018_heartbeat_composite_index,
     )
 )
+
+
+# ── Migration 019: Indexes for system prompt context queries ─────────────────
+
+
+def _019_agent_context_indexes(session: Session) -> None:
+    """Index the memory and agent-work lookups run on every chat turn."""
+    session.execute(text("CREATE INDEX IF NOT EXISTS ix_agent_memories_updated_at ON agent_memories (updated_at)"))
+    session.execute(text("CREATE INDEX IF NOT EXISTS ix_agent_work_status_started ON agent_work (status, started_at)"))
+    session.execute(
+        text("CREATE INDEX IF NOT EXISTS ix_agent_work_status_completed ON agent_work (status, completed_at)")
+    )
+    session.flush()
+    logger.info("Created agent context indexes")
+
+
+MIGRATIONS.append(
+    (
+        "019_agent_context_indexes",
+        "Add indexes on agent_memories(updated_at) and agent_work(status, started_at/completed_at)",
+        _019_agent_context_indexes,
+    )
+)
+
+
+# ── Migration 020: Composite index for pending-reminder range scans ──────────
+
+
+def _020_reminders_pending_index(session: Session) -> None:
+    """Index pending reminders by time for the delivery job and agenda range queries."""
+    session.execute(
+        text("CREATE INDEX IF NOT EXISTS ix_reminders_delivered_remind_at ON reminders (delivered, remind_at)")
+    )
+    session.flush()
+    logger.info("Created reminders (delivered, remind_at) index")
+
+
+MIGRATIONS.append(
+    (
+        "020_reminders_pending_index",
+        "Add composite index on reminders(delivered, remind_at) for pending-reminder range queries",
+        _020_reminders_pending_index,
+    )
+)
+
+
+# ── Migration 021: Composite index for status/due-date task queries ──────────
+
+
+def _021_tasks_status_due_index(session: Session) -> None:
+    """Index tasks by (status, due_date) so backlog counts and due/overdue lookups are index-only."""
+    session.execute(text("CREATE INDEX IF NOT EXISTS ix_tasks_status_due_date ON tasks (status, due_date)"))
+    session.flush()
+    logger.info("Created tasks (status, due_date) index")
+
+
+MIGRATIONS.append(
+    (
+        "021_tasks_status_due_index",
+        "Add composite index on tasks(status, due_date) for backlog counts and due-date queries",
+        _021_tasks_status_due_index,
+    )
+)
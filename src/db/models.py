@@ -87,6 +87,7 @@ class UserProject(Base):
 
 class Task(Base):
     __tablename__ = "tasks"
+    __table_args__ = (Index("ix_tasks_status_due_date", "status", "due_date"),)
 
     id: Mapped[int] = mapped_column(primary_key=True)
     title: Mapped[str] = mapped_column(String(255))
@@ -129,6 +130,7 @@ class Attachment(Base):
 
 class Reminder(Base):
     __tablename__ = "reminders"
+    __table_args__ = (Index("ix_reminders_delivered_remind_at", "delivered", "remind_at"),)
 
     id: Mapped[int] = mapped_column(primary_key=True)
     task_id: Mapped[int | None] = mapped_column(ForeignKey("tasks.id"), nullable=True)
@@ -282,6 +284,7 @@ class AgentMemory(Base):
     """Long-term memory for the agent — preferences, facts, decisions."""
 
     __tablename__ = "agent_memories"
+    __table_args__ = (Index("ix_agent_memories_updated_at", "updated_at"),)
 
     id: Mapped[int] = mapped_column(primary_key=True)
     key: Mapped[str] = mapped_column(String(200), unique=True)
@@ -326,6 +329,10 @@ class AgentWork(Base):
     """Mutable tracker for in-progress subagent work."""
 
     __tablename__ = "agent_work"
+    __table_args__ = (
+        Index("ix_agent_work_status_started", "status", "started_at"),
+        Index("ix_agent_work_status_completed", "status", "completed_at"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     agent_name: Mapped[str] = mapped_column(String(50))  # researcher, planner, etc.
@@ -1,9 +1,10 @@
-from collections.abc import Sequence
+from collections.abc import Iterable, Iterator, Sequence
 from datetime import UTC, datetime, timedelta
-from typing import TYPE_CHECKING, Any, cast
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Literal, cast
 
-from sqlalchemy import delete, select
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.orm import Session, aliased, selectinload
 from sqlalchemy.sql import Select
 
 if TYPE_CHECKING:
@@ -58,6 +59,18 @@ def _shopping_item_query() -> Select[tuple[ShoppingItem]]:
     )
 
 
+# SQLite caps bound parameters per statement (999 on older builds), so large
+# IN (...) lists are split into batches of this size.
+IN_CLAUSE_CHUNK_SIZE = 500
+
+
+def chunked(items: Iterable[Any], size: int = IN_CLAUSE_CHUNK_SIZE) -> Iterator[list[Any]]:
+    """Yield successive lists of at most `size` items."""
+    it = iter(items)
+    while batch := list(islice(it, size)):
+        yield batch
+
+
 # ============================================================================
 # Default projects to seed
 DEFAULT_PROJECTS = [
@@ -73,11 +86,11 @@ DEFAULT_PROJECTS = [
 # Project CRUD
 def seed_default_projects(session: Session) -> None:
     """Seed default projects if they don't exist."""
-    for name, emoji in DEFAULT_PROJECTS:
-        existing = session.scalars(select(Project).where(Project.name == name)).first()
-        if not existing:
-            session.add(Project(name=name, emoji=emoji))
-    session.flush()
+    existing = set(session.scalars(select(Project.name)).all())
+    rows = [{"name": name, "emoji": emoji} for name, emoji in DEFAULT_PROJECTS if name not in existing]
+    if rows:
+        # A single multi-row INSERT ... VALUES statement rather than one INSERT per project
+        session.execute(insert(Project).values(rows))
 
 
 def get_project_by_name(session: Session, name: str) -> Project | None:
@@ -244,8 +257,8 @@ def bulk_update_tasks_project(session: Session, task_ids: list[int], user_projec
 
     if not task_ids:
         return []
-    stmt = update(Task).where(Task.id.in_(task_ids)).values(user_project_id=user_project_id)
-    session.execute(stmt)
+    for batch in chunked(task_ids):
+        session.execute(update(Task).where(Task.id.in_(batch)).values(user_project_id=user_project_id))
     session.flush()
     return task_ids
 
@@ -440,6 +453,18 @@ def count_backlog_tasks(session: Session) -> int:
     return session.scalar(stmt) or 0
 
 
+def count_tasks_by_status(session: Session, status: TaskStatus) -> int:
+    """Count tasks with the given status."""
+    stmt = select(func.count()).select_from(Task).where(Task.status == status)
+    return session.scalar(stmt) or 0
+
+
+def list_tasks_updated_since(session: Session, status: TaskStatus, since: datetime) -> Sequence[Task]:
+    """Get tasks with the given status last updated at or after `since` (e.g. completed today)."""
+    stmt = select(Task).where(Task.status == status).where(Task.updated_at >= since).order_by(Task.updated_at.desc())
+    return session.scalars(stmt).all()
+
+
 def get_subtasks(session: Session, task_id: int) -> Sequence[Task]:
     """Get all subtasks of a given task."""
     stmt = _task_query().where(Task.parent_id == task_id).order_by(Task.created_at)
@@ -464,6 +489,12 @@ def search_tasks(session: Session, query: str) -> Sequence[Task]:
     return session.scalars(stmt).all()
 
 
+def find_tasks_by_title(session: Session, title: str) -> Sequence[Task]:
+    """Find tasks whose title equals `title`, ignoring case (no wildcard matching)."""
+    stmt = _task_query().where(func.casefold(Task.title) == title.casefold()).order_by(Task.created_at.desc())
+    return session.scalars(stmt).all()
+
+
 # Reminder CRUD
 def create_reminder(
     session: Session,
@@ -479,10 +510,19 @@ def create_reminder(
     return reminder
 
 
-def list_pending_reminders(session: Session, before: datetime | None = None) -> Sequence[Reminder]:
+def list_pending_reminders(
+    session: Session,
+    before: datetime | None = None,
+    after: datetime | None = None,
+    with_task: bool = False,
+) -> Sequence[Reminder]:
     stmt = select(Reminder).where(Reminder.delivered == False).order_by(Reminder.remind_at)
+    if with_task:
+        stmt = stmt.options(selectinload(Reminder.task))
     if before:
         stmt = stmt.where(Reminder.remind_at <= before)
+    if after:
+        stmt = stmt.where(Reminder.remind_at >= after)
     return session.scalars(stmt).all()
 
 
@@ -630,11 +670,10 @@ def list_attachments_by_task(session: Session, task_id: int) -> Sequence[Attachm
 # Shopping List CRUD
 def seed_default_shopping_lists(session: Session) -> None:
     """Seed default shopping lists if they don't exist."""
-    for list_type in ShoppingListType:
-        existing = session.scalars(select(ShoppingList).where(ShoppingList.list_type == list_type)).first()
-        if not existing:
-            session.add(ShoppingList(list_type=list_type))
-    session.flush()
+    existing = set(session.scalars(select(ShoppingList.list_type)).all())
+    rows = [{"list_type": list_type} for list_type in ShoppingListType if list_type not in existing]
+    if rows:
+        session.execute(insert(ShoppingList).values(rows))
 
 
 def get_shopping_list_by_type(session: Session, list_type: ShoppingListType) -> ShoppingList | None:
@@ -683,6 +722,12 @@ def get_shopping_item(session: Session, item_id: int) -> ShoppingItem | None:
     return session.scalars(stmt).first()
 
 
+def find_shopping_items_by_name(session: Session, name: str) -> Sequence[ShoppingItem]:
+    """Find shopping items whose name equals `name`, ignoring case (no wildcard matching)."""
+    stmt = _shopping_item_query().where(func.casefold(ShoppingItem.name) == name.casefold()).order_by(ShoppingItem.id)
+    return session.scalars(stmt).all()
+
+
 def list_shopping_items(
     session: Session,
     list_type: ShoppingListType | None = None,
@@ -844,6 +889,12 @@ def update_contact(
     return contact
 
 
+def find_contacts_by_name(session: Session, name: str) -> Sequence[Contact]:
+    """Find contacts whose name equals `name`, ignoring case (no wildcard matching). Aliases are not considered."""
+    stmt = select(Contact).where(func.casefold(Contact.name) == name.casefold()).order_by(Contact.id)
+    return session.scalars(stmt).all()
+
+
 def delete_contact(session: Session, contact_id: int) -> bool:
     """Delete a contact."""
     contact = session.get(Contact, contact_id)
@@ -898,11 +949,11 @@ def get_task_counts_by_contacts(session: Session, contact_ids: list[int]) -> dic
 
     from sqlalchemy import func
 
-    stmt = (
-        select(Task.contact_id, func.count(Task.id)).where(Task.contact_id.in_(contact_ids)).group_by(Task.contact_id)
-    )
-    results = session.execute(stmt).all()
-    return {contact_id: count for contact_id, count in results}  # noqa: C416
+    counts: dict[int, int] = {}
+    for batch in chunked(contact_ids):
+        stmt = select(Task.contact_id, func.count(Task.id)).where(Task.contact_id.in_(batch)).group_by(Task.contact_id)
+        counts.update(session.execute(stmt).tuples().all())
+    return counts
 
 
 def get_gifts_by_contact(session: Session, contact_id: int) -> Sequence[ShoppingItem]:
@@ -1452,10 +1503,18 @@ def log_agent_event(
     return event
 
 
-def get_recent_events(session: Session, limit: int = 30, since_hours: int = 24) -> Sequence[AgentEvent]:
-    """Get recent events from the bus for system prompt injection."""
+def get_recent_events(
+    session: Session, limit: int = 30, since_hours: int = 24, order: Literal["asc", "desc"] = "desc"
+) -> Sequence[AgentEvent]:
+    """Get the latest `limit` events from the bus for system prompt injection.
+
+    order="asc" returns that same window oldest-first (chronological), sorted in SQL.
+    """
     cutoff = datetime.now(UTC) - timedelta(hours=since_hours)
     stmt = select(AgentEvent).where(AgentEvent.timestamp >= cutoff).order_by(AgentEvent.timestamp.desc()).limit(limit)
+    if order == "asc":
+        latest = aliased(AgentEvent, stmt.subquery())
+        stmt = select(latest).order_by(latest.timestamp.asc())
     return session.scalars(stmt).all()
 
 
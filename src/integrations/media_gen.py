@@ -17,7 +17,7 @@ from src.config import settings
 
 logger = logging.getLogger(__name__)
 
-MEDIA_DIR = Path("data/media")
+MEDIA_DIR = settings.media_dir
 
 VEO_MODELS = {
     "veo-3.1-lite": "veo-3.1-lite-generate-preview",
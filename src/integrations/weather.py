@@ -1,6 +1,7 @@
 """Open-Meteo weather integration (free, no API key)."""
 
 import logging
+import time
 
 import httpx
 
@@ -32,8 +33,20 @@ _WMO_CODES = {
 }
 
 
+# Current conditions change slowly; reuse a fetch for a few minutes so agenda,
+# dashboard and profile calls don't each make a round-trip to Open-Meteo.
+_CACHE_TTL_SECONDS = 300.0
+_cache: dict[tuple[float, float], tuple[float, dict]] = {}
+
+
 def fetch_weather(lat: float, lon: float) -> dict | None:
-    """Fetch current weather from Open-Meteo API."""
+    """Fetch current weather from Open-Meteo API (cached per location for a few minutes)."""
+    key = (round(lat, 2), round(lon, 2))
+    now = time.monotonic()
+    cached = _cache.get(key)
+    if cached is not None and now - cached[0] < _CACHE_TTL_SECONDS:
+        return cached[1]
+
     try:
         resp = httpx.get(
             "https://api.open-meteo.com/v1/forecast",
@@ -46,11 +59,14 @@ def fetch_weather(lat: float, lon: float) -> dict | None:
             timeout=10,
         )
         resp.raise_for_status()
-        return resp.json()
+        data = resp.json()
     except Exception as e:
         logger.warning(f"Weather fetch failed: {e}")
         return None
 
+    _cache[key] = (now, data)
+    return data
+
 
 def format_weather(data: dict) -> str:
     """Format weather data as a readable string."""
@@ -68,8 +68,8 @@ def register_jobs() -> None:
 
 
 async def _init_mcp_and_agent() -> None:
-    """Initialize MCP servers and inject tools into the Agno agent."""
-    from src.agent.agent import set_mcp_tools
+    """Initialize MCP servers, inject their tools and pre-build the Agno teams."""
+    from src.agent.agent import set_mcp_tools, warmup
     from src.agent.mcp import init_mcp_servers
 
     try:
@@ -79,9 +79,20 @@ async def _init_mcp_and_agent() -> None:
     except Exception as e:
         logger.warning(f"MCP init failed (agent will work without MCP tools): {e}")
 
+    try:
+        await warmup()
+    except Exception as e:
+        logger.warning(f"Agent warmup failed (teams will be built on first message): {e}")
+
 
 async def post_init(application) -> None:
     """Called after the application is initialized with event loop running."""
+    # Python 3.12+: coroutines that finish without suspending (cache hits, early
+    # returns) complete inside create_task() instead of taking a loop iteration.
+    eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+    if eager_task_factory is not None:
+        asyncio.get_running_loop().set_task_factory(eager_task_factory)
+
     from src.telegram.bot import register_commands
 
     logger.info("Registering bot commands...")
@@ -111,12 +122,22 @@ async def post_shutdown(application) -> None:
     try:
         from src.agent import shutdown
 
-        if shutdown:
-            await shutdown()
+        await shutdown()
     except Exception as e:
         logger.warning(f"Error shutting down agent: {e}")
 
 
+def _install_uvloop() -> None:
+    """Use uvloop's libuv event loop when available (it doesn't support Windows)."""
+    try:
+        import uvloop
+    except ImportError:
+        return
+    # uvloop.install() warns on 3.12+; setting the policy directly is the supported route
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.info("Using uvloop event loop")
+
+
 def start_web_server() -> None:
     """Start the OAuth web server in a daemon thread."""
     from src.web.server import run_server
@@ -128,6 +149,8 @@ def start_web_server() -> None:
 
 def main() -> None:
     """Start the bot."""
+    _install_uvloop()
+
     logger.info("Initializing database...")
     init_database(settings.database_path)
 
@@ -1,7 +1,9 @@
 """Proactive heartbeat engine — autonomous agent that runs on a schedule."""
 
+import functools
 import logging
 from datetime import datetime
+from typing import Any
 
 from src.agent.tools.agenda import get_agenda
 from src.agent.tools.mood import show_mood_history
@@ -23,6 +25,7 @@ from src.db.queries import (
 from src.db.queries import (
     list_overdue_tasks as db_list_overdue,
 )
+from src.utils import days_overdue, format_long_date
 
 logger = logging.getLogger(__name__)
 
@@ -95,7 +98,7 @@ def _build_context() -> str:
     lines = []
 
     now = datetime.now(settings.timezone)
-    lines.append(f"Current time: {now.strftime('%A, %B %d, %Y at %H:%M')}")
+    lines.append(f"Current time: {format_long_date(now)} at {now.hour:02d}:{now.minute:02d}")
 
     # Agenda
     try:
@@ -118,8 +121,7 @@ def _build_context() -> str:
         if overdue:
             lines.append(f"\nOverdue tasks ({len(overdue)}):")
             for t in overdue[:5]:
-                days = (now_naive - t.due_date).days if t.due_date else 0
-                lines.append(f"  #{t.id}: {t.title} ({days}d overdue)")
+                lines.append(f"  #{t.id}: {t.title} ({days_overdue(t.due_date, now_naive)}d overdue)")
 
         # Due soon
         due_soon = list_tasks_due_soon(session, now_naive, within_hours=24)
@@ -147,10 +149,10 @@ def _build_context() -> str:
     # Recent event bus activity (user messages, agent responses, notifications)
     try:
         with session_scope() as session:
-            events = get_recent_events(session, limit=20, since_hours=24)
+            events = get_recent_events(session, limit=20, since_hours=24, order="asc")
             if events:
                 lines.append("\nRecent activity (event bus):")
-                for e in reversed(events):
+                for e in events:
                     ts = e.timestamp.strftime("%H:%M") if e.timestamp else "?"
                     lines.append(f"  [{ts} {e.source}] {e.event_type}: {e.summary[:150]}")
 
@@ -211,13 +213,9 @@ def _build_recent_actions() -> str:
 HEARTBEAT_TIMEOUT = 300  # 5 minutes — hard cap so a hung tool can't freeze the bot
 
 
-async def _run_heartbeat_agno(prompt: str) -> str | None:
-    """Run a heartbeat cycle using an Agno Agent (with timeout)."""
-    import asyncio
-
-    from agno.agent import Agent
-    from agno.models.openai import OpenAIChat
-
+@functools.cache
+def _heartbeat_tools() -> tuple[Any, ...]:
+    """Return the heartbeat agent's tools, built once per process."""
     from src.agent.tools import (
         beads_create,
         beads_list,
@@ -245,7 +243,7 @@ async def _run_heartbeat_agno(prompt: str) -> str | None:
         web_search,
     )
 
-    heartbeat_tools = [
+    return (
         get_current_datetime,
         get_agenda,
         get_overdue_tasks,
@@ -271,12 +269,21 @@ async def _run_heartbeat_agno(prompt: str) -> str | None:
         recall_memory,
         list_memories,
         forget_memory,
-    ]
+    )
+
+
+async def _run_heartbeat_agno(prompt: str) -> str | None:
+    """Run a heartbeat cycle using an Agno Agent (with timeout)."""
+    import asyncio
+
+    from agno.agent import Agent
+
+    from src.agent.team import get_model
 
     agent = Agent(
         name="Heartbeat",
-        model=OpenAIChat(id=settings.heartbeat_model, api_key=settings.openai_api_key),
-        tools=heartbeat_tools,
+        model=get_model(settings.heartbeat_model),
+        tools=list(_heartbeat_tools()),
         instructions=[prompt],
         telemetry=False,
     )
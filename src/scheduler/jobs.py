@@ -7,12 +7,13 @@ from src.config import settings
 from src.db import session_scope
 from src.db.models import TaskStatus
 from src.db.queries import (
+    count_tasks_by_status,
     create_next_recurring_instance,
     get_mood_log,
-    get_task,
     list_completed_recurring_tasks,
     list_pending_reminders,
     list_tasks_by_status,
+    list_tasks_updated_since,
     mark_reminder_delivered,
 )
 from src.notifications import notify
@@ -80,15 +81,12 @@ async def eod_review() -> None:
             today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
 
             # Get tasks completed today
-            done_tasks = list_tasks_by_status(session, TaskStatus.DONE)
-            completed_today = [
-                (t.id, t.title) for t in done_tasks if t.updated_at and t.updated_at >= today_start.replace(tzinfo=None)
-            ]
+            done_today = list_tasks_updated_since(session, TaskStatus.DONE, today_start.replace(tzinfo=None))
+            completed_today = [(t.id, t.title) for t in done_today]
 
             # Get incomplete tasks
-            todo_tasks = list_tasks_by_status(session, TaskStatus.TODO)
             in_progress = [(t.id, t.title) for t in list_tasks_by_status(session, TaskStatus.IN_PROGRESS)]
-            todo_count = len(todo_tasks)
+            todo_count = count_tasks_by_status(session, TaskStatus.TODO)
 
             # Tomorrow's agenda
             tomorrow = (now + timedelta(days=1)).strftime("%Y-%m-%d")
@@ -162,7 +160,7 @@ async def deliver_reminders() -> None:
     try:
         with session_scope() as session:
             now = datetime.now(settings.timezone).replace(tzinfo=None)
-            reminders = list_pending_reminders(session, now)
+            reminders = list_pending_reminders(session, now, with_task=True)
 
             if not reminders:
                 return
@@ -172,10 +170,8 @@ async def deliver_reminders() -> None:
             reminder_ids = []
             for r in reminders:
                 line = f"- Reminder #{r.id}: {r.message}"
-                if r.task_id:
-                    task = get_task(session, r.task_id)
-                    if task:
-                        line += f" (linked to task #{task.id}: {task.title})"
+                if r.task:
+                    line += f" (linked to task #{r.task.id}: {r.task.title})"
                 reminder_lines.append(line)
                 reminder_ids.append(r.id)
 
@@ -1,7 +1,7 @@
 import asyncio
 import logging
+import secrets
 import time as _time
-import uuid
 from datetime import datetime
 
 from telegram.error import BadRequest
@@ -72,7 +72,7 @@ async def safe_reply(message, text: str) -> None:
             await message.reply_text(chunk, parse_mode="HTML")
         except BadRequest as e:
             if "Can't parse entities" in str(e):
-                logger.warning(f"HTML parse failed, sending as plain text: {e}")
+                logger.warning("HTML parse failed, sending as plain text: %s", e)
                 await message.reply_text(chunk)
             else:
                 raise
@@ -85,7 +85,7 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         return
 
     user_message = update.message.text
-    logger.info(f"Received message: {user_message[:50]}...")
+    logger.info("Received message: %.50s...", user_message)
 
     # Log to event bus
     try:
@@ -101,12 +101,7 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         clear_command_context()
 
     try:
-        # Use streaming if SDK is enabled and chat_stream is available
-        if chat_stream is not None:
-            await _handle_streaming_message(update, user_message)
-        else:
-            response = await chat(user_message)
-            await safe_reply(update.message, response)
+        await _handle_streaming_message(update, user_message)
     except Exception as e:
         logger.exception("Error processing message")
         await update.message.reply_text(f"Sorry, I encountered an error: {str(e)[:100]}")
@@ -125,14 +120,14 @@ async def _handle_streaming_message(update: Update, user_message: str) -> None:
     message = update.message
     status_msg = None
     status_lines: list[str] = []
-    accumulated = ""
+    text_chunks: list[str] = []
     last_edit = 0.0
     _MAX_STATUS_LINES = 6
 
     async def _update_status() -> None:
         """Create or edit the italic status message."""
         nonlocal status_msg, last_edit
-        now = _time.time()
+        now = _time.monotonic()
         display = "<i>" + "\n".join(status_lines[-_MAX_STATUS_LINES:]) + "</i>"
         if status_msg is None:
             status_msg = await message.reply_text(display, parse_mode="HTML")
@@ -159,7 +154,7 @@ async def _handle_streaming_message(update: Update, user_message: str) -> None:
                         await _update_status()
 
                 elif event_type == "text":
-                    accumulated += data
+                    text_chunks.append(data)
 
                 elif event_type == "result":
                     pass  # generator ends naturally after this
@@ -170,16 +165,18 @@ async def _handle_streaming_message(update: Update, user_message: str) -> None:
                 await status_msg.delete()
 
         # Send final response
-        text = accumulated.strip() or "Done."
+        text = "".join(text_chunks).strip() or "Done."
         await safe_reply(message, text)
     except TimeoutError:
-        logger.error("Streaming timed out after %d seconds, accumulated %d chars", AGENT_TIMEOUT, len(accumulated))
+        logger.error(
+            "Streaming timed out after %d seconds, accumulated %d chars", AGENT_TIMEOUT, sum(map(len, text_chunks))
+        )
         if status_msg:
             with contextlib.suppress(Exception):
                 await status_msg.delete()
         await safe_reply(message, "Sorry, that took too long (20 min limit). Try a simpler request.")
     except Exception:
-        logger.exception("Streaming error (%d chars accumulated), falling back to chat()", len(accumulated))
+        logger.exception("Streaming error (%d chars accumulated), falling back to chat()", sum(map(len, text_chunks)))
         if status_msg:
             with contextlib.suppress(Exception):
                 await status_msg.delete()
@@ -205,7 +202,7 @@ async def handle_voice(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
 
         # Transcribe
         transcript = transcribe_voice(bytes(audio_data), "voice.ogg")
-        logger.info(f"Transcribed: {transcript[:50]}...")
+        logger.info("Transcribed: %.50s...", transcript)
 
         # Send transcript and process with agent
         await safe_reply(update.message, f"<i>Heard: {transcript}</i>")
@@ -238,9 +235,8 @@ async def handle_photo(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
 
         # Save to disk so agent tools (edit_image, generate_video) can reference it
         import os
-        from pathlib import Path
 
-        inbox_dir = Path("data/media/inbox")
+        inbox_dir = settings.media_dir / "inbox"
         inbox_dir.mkdir(parents=True, exist_ok=True)
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         saved_path = inbox_dir / f"photo_{timestamp}_{photo.file_unique_id}.jpg"
@@ -250,7 +246,7 @@ async def handle_photo(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
 
         # Analyze image
         analysis = extract_task_from_image(bytes(image_data))
-        logger.info(f"Image analysis: {analysis[:50]}...")
+        logger.info("Image analysis: %.50s...", analysis)
 
         # Get caption if any
         caption = update.message.caption or ""
@@ -367,7 +363,7 @@ async def send_message(text: str, parse_mode: str = "HTML") -> None:
             )
         except BadRequest as e:
             if "Can't parse entities" in str(e):
-                logger.warning(f"HTML parse failed in send_message, sending plain: {e}")
+                logger.warning("HTML parse failed in send_message, sending plain: %s", e)
                 await bot.send_message(
                     chat_id=settings.telegram_user_id,
                     text=chunk,
@@ -419,13 +415,13 @@ async def notify_error(tool_name: str, error: Exception, error_id: str | None =
     if tool_name in _last_error_notification:
         elapsed = (now - _last_error_notification[tool_name]).total_seconds()
         if elapsed < _ERROR_RATE_LIMIT_SECONDS:
-            logger.debug(f"Skipping error notification for {tool_name}, rate limited")
+            logger.debug("Skipping error notification for %s, rate limited", tool_name)
             return
 
     _last_error_notification[tool_name] = now
 
     if not error_id:
-        error_id = str(uuid.uuid4())[:8]
+        error_id = secrets.token_hex(4)
 
     # Brief error message without sensitive details
     error_msg = str(error)[:100]
@@ -435,4 +431,4 @@ async def notify_error(tool_name: str, error: Exception, error_id: str | None =
     try:
         await send_message(text)
     except Exception as e:
-        logger.error(f"Failed to send error notification: {e}")
+        logger.error("Failed to send error notification: %s", e)
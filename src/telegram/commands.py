@@ -18,7 +18,7 @@ from src.integrations.calendar import (
     is_calendar_connected,
     is_calendar_connected_for_user,
 )
-from src.utils import days_until_birthday, format_birthday_proximity
+from src.utils import days_until_birthday, format_birthday_proximity, format_day_heading
 from telegram import Update
 
 # Track last command output for agent context injection
@@ -78,7 +78,7 @@ async def tasks_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
 async def today_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /today command - show today's agenda."""
     assert update.message  # guaranteed by @require_auth
-    today_str = datetime.now(settings.timezone).strftime("%A, %b %d")
+    today_str = format_day_heading(datetime.now(settings.timezone))
     result = get_agenda()
 
     output = f"{today_str}\n\n{result}"
@@ -104,11 +104,11 @@ async def calendar_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -
 
         current_day = None
         for event in events:
-            event_day = event.start_time.strftime("%A, %b %d")
+            event_day = event.start_time.date()
             if event_day != current_day:
                 if current_day is not None:
                     lines.append("")
-                lines.append(event_day)
+                lines.append(format_day_heading(event_day))
                 current_day = event_day
 
             time_str = event.start_time.strftime("%H:%M")
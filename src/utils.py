@@ -1,9 +1,28 @@
-from datetime import date, datetime
-
-import dateparser
+from datetime import date, datetime, timedelta
 
 from src.config import settings
 
+# English names, indexed like date.weekday() and date.month; avoids locale-aware strftime("%A"/"%B")
+WEEKDAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+MONTHS = (
+    "",
+    "January",
+    "February",
+    "March",
+    "April",
+    "May",
+    "June",
+    "July",
+    "August",
+    "September",
+    "October",
+    "November",
+    "December",
+)
+
+# Day offsets for the most common relative inputs, answered without dateparser
+_RELATIVE_DAYS = {"today": 0, "now": 0, "tomorrow": 1, "yesterday": -1}
+
 
 def parse_date(text: str) -> datetime | None:
     """Parse natural language date/time strings.
@@ -23,13 +42,19 @@ def parse_date(text: str) -> datetime | None:
     if not text:
         return None
 
+    offset = _RELATIVE_DAYS.get(text.strip().lower())
+    if offset is not None:
+        return datetime.now(settings.timezone).replace(tzinfo=None) + timedelta(days=offset)
+
     # Try ISO format first (fast path)
     try:
         return datetime.fromisoformat(text)
     except ValueError:
         pass
 
-    # Use dateparser for natural language
+    # Use dateparser for natural language (imported lazily: it loads locale data)
+    import dateparser
+
     parsed = dateparser.parse(
         text,
         settings={
@@ -61,6 +86,21 @@ def format_date(dt: datetime | None, include_time: bool = False) -> str:
     return dt.strftime("%b %d")
 
 
+def format_long_date(dt: date | datetime) -> str:
+    """Format a date like "Monday, January 05, 2026" (same as strftime("%A, %B %d, %Y"))."""
+    return f"{WEEKDAYS[dt.weekday()]}, {MONTHS[dt.month]} {dt.day:02d}, {dt.year}"
+
+
+def format_day_heading(dt: date | datetime) -> str:
+    """Format a date like "Monday, Jan 05" (same as strftime("%A, %b %d"))."""
+    return f"{WEEKDAYS[dt.weekday()]}, {MONTHS[dt.month][:3]} {dt.day:02d}"
+
+
+def days_overdue(due_date: datetime | None, now: datetime) -> int:
+    """Whole calendar days between a due date and now (a task due yesterday evening is 1 day overdue)."""
+    return now.toordinal() - due_date.toordinal() if due_date else 0
+
+
 def days_until_birthday(birthday: date | datetime, today: date) -> int:
     """Calculate the number of days until the next occurrence of a birthday."""
     bday = birthday.date() if isinstance(birthday, datetime) else birthday
@@ -786,27 +786,20 @@ async def api_chat_stream(body: ChatRequest):
     from src.agent import AGENT_TIMEOUT, chat_stream
 
     async def event_generator():
-        if chat_stream is None:
-            # Fallback to non-streaming
-            from src.agent import chat
-
-            response = await chat(body.message, format_hint="web")
-            yield f"data: {json.dumps({'type': 'text', 'text': response})}\n\n"
-        else:
-            try:
-                async with asyncio.timeout(AGENT_TIMEOUT):
-                    async for event_type, data in chat_stream(body.message, format_hint="web"):
-                        if event_type == "text":
-                            yield f"data: {json.dumps({'type': 'text', 'text': data})}\n\n"
-                        elif event_type == "tool_call":
-                            yield f"data: {json.dumps({'type': 'tool_call', 'name': data})}\n\n"
-                        elif event_type == "thinking":
-                            yield f"data: {json.dumps({'type': 'thinking', 'text': data})}\n\n"
-                        elif event_type == "result":
-                            pass  # generator ends naturally after this
-            except TimeoutError:
-                logger.error("SSE stream timed out after %d seconds", AGENT_TIMEOUT)
-                yield f"data: {json.dumps({'type': 'error', 'text': 'Request timed out (20 min limit)'})}\n\n"
+        try:
+            async with asyncio.timeout(AGENT_TIMEOUT):
+                async for event_type, data in chat_stream(body.message, format_hint="web"):
+                    if event_type == "text":
+                        yield f"data: {json.dumps({'type': 'text', 'text': data})}\n\n"
+                    elif event_type == "tool_call":
+                        yield f"data: {json.dumps({'type': 'tool_call', 'name': data})}\n\n"
+                    elif event_type == "thinking":
+                        yield f"data: {json.dumps({'type': 'thinking', 'text': data})}\n\n"
+                    elif event_type == "result":
+                        pass  # generator ends naturally after this
+        except TimeoutError:
+            logger.error("SSE stream timed out after %d seconds", AGENT_TIMEOUT)
+            yield f"data: {json.dumps({'type': 'error', 'text': 'Request timed out (20 min limit)'})}\n\n"
         yield "data: [DONE]\n\n"
 
     return StreamingResponse(event_generator(), media_type="text/event-stream")
@@ -23,7 +23,7 @@ _pending_codes: dict[str, tuple[int, float]] = {}
 
 
 def _purge_expired_codes() -> None:
-    now = time.time()
+    now = time.monotonic()
     expired = [k for k, (_, t) in _pending_codes.items() if now - t > _CODE_TTL]
     for k in expired:
         del _pending_codes[k]
@@ -55,7 +55,7 @@ async def request_code(body: RequestCodeBody):
     _purge_expired_codes()
 
     code = f"{secrets.randbelow(900000) + 100000}"
-    _pending_codes[code] = (body.telegram_user_id, time.time())
+    _pending_codes[code] = (body.telegram_user_id, time.monotonic())
 
     # Send code via Telegram
     if settings.telegram_bot_token:
@@ -90,7 +90,7 @@ async def start_auth(telegram_user_id: int):
         flow = _create_flow()
 
         # Purge expired flows
-        now = time.time()
+        now = time.monotonic()
         expired = [k for k, (_, _, t) in _pending_flows.items() if now - t > _FLOW_TTL]
         for k in expired:
             del _pending_flows[k]
@@ -77,8 +77,7 @@ async def dashboard(request: Request):
         overdue = list_overdue_tasks(session, day_start)
         in_progress = list_tasks_by_status(session, TaskStatus.IN_PROGRESS)
         events = list_calendar_events_range(session, day_start, day_end)
-        reminders = list_pending_reminders(session, day_end)
-        today_reminders = [r for r in reminders if r.remind_at >= day_start]
+        today_reminders = list_pending_reminders(session, day_end, after=day_start)
 
         # Weather
         weather = city = None
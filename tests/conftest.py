@@ -0,0 +1,16 @@
+import os
+
+# src.config reads its settings at import time
+os.environ.setdefault("TELEGRAM_USER_ID", "1")
+os.environ.setdefault("TIMEZONE", "America/Sao_Paulo")
+
+import pytest  # noqa: E402
+
+from src.db import init_database, session_scope  # noqa: E402
+
+
+@pytest.fixture
+def db(tmp_path):
+    """Initialize a fresh SQLite database and yield a session factory."""
+    init_database(tmp_path / "test.db")
+    return session_scope
@@ -0,0 +1,51 @@
+from datetime import datetime
+
+import pytest
+
+from src.agent.tools import agenda
+from src.config import settings
+from src.db.queries import create_contact, create_task, update_contact
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    agenda._invalidate_agenda_cache()
+
+
+def _due_today() -> datetime:
+    return datetime.now(settings.timezone).replace(hour=23, minute=0, second=0, microsecond=0, tzinfo=None)
+
+
+def test_commit_invalidates_cached_agenda(db):
+    assert "No tasks due today" in agenda.get_agenda()
+
+    with db() as session:
+        create_task(session, "water plants", due_date=_due_today())
+
+    assert "water plants" in agenda.get_agenda()
+
+
+def test_rolled_back_write_keeps_cache(db):
+    agenda.get_agenda()
+    generation = agenda._agenda_generation
+
+    with pytest.raises(RuntimeError), db() as session:
+        create_task(session, "never saved", due_date=_due_today())
+        raise RuntimeError
+
+    assert agenda._agenda_generation == generation
+    assert agenda._agenda_cache
+
+
+def test_contact_rename_invalidates_cached_agenda(db):
+    with db() as session:
+        contact = create_contact(session, "Alice")
+        create_task(session, "call", due_date=_due_today(), contact_id=contact.id)
+        contact_id = contact.id
+
+    assert "call Alice" in agenda.get_agenda()
+
+    with db() as session:
+        update_contact(session, contact_id, name="Bob")
+
+    assert "call Bob" in agenda.get_agenda()
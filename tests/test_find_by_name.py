@@ -0,0 +1,52 @@
+import pytest
+
+from src.agent.tools.contacts import remove_contact
+from src.agent.tools.shopping import remove_item
+from src.agent.tools.tasks import delete_task_tool
+from src.db.models import Contact, ShoppingItem, ShoppingListType, Task
+from src.db.queries import (
+    create_contact,
+    create_shopping_item,
+    create_task,
+    find_contacts_by_name,
+    find_shopping_items_by_name,
+    find_tasks_by_title,
+)
+
+
+@pytest.fixture
+def named_rows(db):
+    with db() as session:
+        for title in ("buy milk", "buy-milk", "Água"):
+            create_task(session, title)
+            create_shopping_item(session, ShoppingListType.GROCERIES, title)
+            create_contact(session, title)
+    return db
+
+
+@pytest.mark.parametrize("pattern", ["buy_milk", "%", "buy%", "_"])
+def test_wildcards_match_nothing(named_rows, pattern):
+    with named_rows() as session:
+        assert find_tasks_by_title(session, pattern) == []
+        assert find_shopping_items_by_name(session, pattern) == []
+        assert find_contacts_by_name(session, pattern) == []
+
+
+def test_case_insensitive_including_non_ascii(named_rows):
+    with named_rows() as session:
+        assert [t.title for t in find_tasks_by_title(session, "BUY MILK")] == ["buy milk"]
+        assert [t.title for t in find_tasks_by_title(session, "água")] == ["Água"]
+        assert [i.name for i in find_shopping_items_by_name(session, "ÁGUA")] == ["Água"]
+        assert [c.name for c in find_contacts_by_name(session, "água")] == ["Água"]
+
+
+@pytest.mark.parametrize("pattern", ["buy_milk", "%"])
+def test_delete_by_wildcard_name_deletes_nothing(named_rows, pattern):
+    assert delete_task_tool(name=pattern).startswith("No task")
+    assert remove_item(name=pattern).startswith("No item")
+    assert remove_contact(name=pattern).startswith("No contact")
+
+    with named_rows() as session:
+        assert session.query(Task).count() == 3
+        assert session.query(ShoppingItem).count() == 3
+        assert session.query(Contact).count() == 3
@@ -0,0 +1,52 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.agent import memory_extractor
+
+
+class _FakeCompletions:
+    def __init__(self, replies):
+        self.replies = list(replies)
+        self.calls = 0
+
+    async def create(self, **_kwargs):
+        self.calls += 1
+        reply = self.replies.pop(0)
+        if isinstance(reply, Exception):
+            raise reply
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=reply))])
+
+
+@pytest.fixture
+def fake_llm(monkeypatch):
+    def install(*replies):
+        completions = _FakeCompletions(replies)
+        client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+        monkeypatch.setattr(memory_extractor, "_get_client", lambda: client)
+        monkeypatch.setattr(memory_extractor, "_recent_exchanges", type(memory_extractor._recent_exchanges)())
+        return completions
+
+    return install
+
+
+def test_failed_extraction_is_retried(db, fake_llm):
+    completions = fake_llm(ConnectionError("boom"), "not json", "[]")
+    exchange = ("I moved to Lisbon", "Noted!")
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(memory_extractor.extract_memories(*exchange))
+    with pytest.raises(ValueError):
+        asyncio.run(memory_extractor.extract_memories(*exchange))
+    assert asyncio.run(memory_extractor.extract_memories(*exchange)) == 0
+    assert completions.calls == 3
+
+
+def test_successful_extraction_is_deduplicated(db, fake_llm):
+    completions = fake_llm('[{"action": "save", "key": "city", "content": "Lisbon"}]')
+    exchange = ("I moved to Lisbon", "Noted!")
+
+    assert asyncio.run(memory_extractor.extract_memories(*exchange)) == 1
+    assert asyncio.run(memory_extractor.extract_memories(*exchange)) == 0
+    assert completions.calls == 1